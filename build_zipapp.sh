@@ -0,0 +1,32 @@
+#!/bin/bash
+# Build a single-file zipapp (gitcast.pyz) containing the gitcast_library
+# package. The interpreter then imports everything from one archive read
+# instead of a stat+open per module file, which trims cold-start time on
+# slow or networked filesystems.
+#
+# The archive holds code only. Data directories (prompts/, repos/,
+# manual_inputs/, the output dir) stay on disk and cannot be resolved
+# relative to the archive, so pass them explicitly:
+#
+#   ./gitcast.pyz --prompt-dir ./prompts --repos-dir ./repos --output-dir ./output_wizcast
+#
+# Third-party dependencies are not bundled; run the .pyz with the project
+# virtualenv's interpreter (or any interpreter that has them installed).
+
+set -euo pipefail
+
+# Get the script's absolute directory
+SCRIPT_DIR=$(cd -- "$(dirname -- "${BASH_SOURCE[0]}")" &> /dev/null && pwd)
+
+STAGING_DIR=$(mktemp -d)
+trap 'rm -rf "$STAGING_DIR"' EXIT
+
+cp -r "$SCRIPT_DIR/gitcast_library" "$STAGING_DIR/"
+find "$STAGING_DIR" -type d -name '__pycache__' -exec rm -rf {} +
+
+python3 -m zipapp "$STAGING_DIR" \
+  -p "/usr/bin/env python3" \
+  -m "gitcast_library.__main__:main" \
+  -o "$SCRIPT_DIR/gitcast.pyz"
+
+echo "Built $SCRIPT_DIR/gitcast.pyz"
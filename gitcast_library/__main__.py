@@ -0,0 +1,92 @@
+# gitcast_library/__main__.py
+"""Package entry point, runnable as `python -m gitcast_library`.
+
+Living inside the package, this needs no sys.path manipulation: the
+interpreter resolves gitcast_library itself, so the same modules load
+identically whether launched via -m, the main.py wrapper, or an import
+from a test harness.
+"""
+import logging
+import sys
+
+# Level-name resolution as one dict hit instead of a getattr against the
+# logging module; argparse already constrains --log-level to these names.
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL, "ERROR": logging.ERROR, "WARNING": logging.WARNING,
+    "INFO": logging.INFO, "DEBUG": logging.DEBUG, "NOTSET": logging.NOTSET,
+}
+
+
+def run_gitcast():
+    """
+    Initializes and runs the GitCast application.
+    On success, prints the relative path of the generated MP3 and exits with 0.
+    On failure, logs an error and exits with 1.
+
+    The gitcast_library imports happen inside this function, staged so that
+    --help, --version, and argument errors exit after loading only the
+    config module, never the orchestrator and its service SDKs.
+    """
+    # Always non-None: setup_logging configures handlers on this same named
+    # logger, and before that logging's last-resort handler covers critical
+    # messages, so the handlers need no is-it-ready guards.
+    logger = logging.getLogger('wizcast')
+    try:
+        # Initialize configuration
+        from .config import AppConfig
+        config = AppConfig()
+
+        # Setup logging with configured options; default to INFO if invalid
+        log_level = _LOG_LEVELS.get(config.args.log_level.upper(), logging.INFO)
+
+        from .utils import setup_logging
+        setup_logging(log_level=log_level, log_file=config.args.log_file)
+
+        logger.info("Initializing GitCast application...")
+        # Imported only once configuration has parsed cleanly: this pulls in
+        # the LLM and TTS SDKs, by far the heaviest part of startup.
+        from .orchestrator import GitCastOrchestrator
+        orchestrator = GitCastOrchestrator(config)
+
+        # run() is typed Optional[str]: the relative MP3 path on success,
+        # None for a clean run that produced no audio, and exceptions for
+        # failures — so no isinstance re-checking of the return value.
+        mp3_relative_path = orchestrator.run()
+
+        if mp3_relative_path:
+            print(mp3_relative_path) # Output the relative path to stdout
+        else:
+            logger.info("Orchestrator completed without generating an MP3 file.")
+        return 0 # Success exit code
+
+
+    except FileNotFoundError as fnf_error:
+        # Known fatal exits write one pre-built line straight to stderr:
+        # no LogRecord, formatter, or handler dispatch, and no guard for
+        # whether logging was configured before the failure.
+        sys.stderr.write(f"ERROR: A required file or directory was not found: {fnf_error}\n")
+        return 1
+    except ValueError as val_error: # For config validation errors
+        sys.stderr.write(f"ERROR: Configuration validation failed: {val_error}\n")
+        return 1
+    except RuntimeError as rt_error: # For service initialization errors etc.
+        sys.stderr.write(f"ERROR: A runtime issue occurred: {rt_error}\n")
+        return 1
+    except Exception as e:
+        # traceback (and its linecache/tokenize baggage) is only imported on
+        # this crash path, never on a successful run.
+        import traceback
+        logger.critical(f"An unexpected critical error occurred: {e}")
+        logger.critical(traceback.format_exc()) # Log full traceback
+        return 1
+
+
+def main():
+    """Console wrapper: converts run_gitcast's return code into the process
+    exit status. zipapp and -c launchers call functions without propagating
+    return values, so the SystemExit has to be raised here."""
+    raise SystemExit(run_gitcast())
+
+
+if __name__ == "__main__":
+    main()
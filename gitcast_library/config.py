@@ -1,121 +1,287 @@
 # gitcast_library/config.py
 import os
-import argparse
+import sys
+import functools
 import logging
-from dotenv import load_dotenv
 from datetime import datetime, date
 
-# Assuming utils.py is in the same directory or handled by PYTHONPATH
-try:
-    from .utils import get_monday_of_week, ensure_dir, logger, setup_logging
-except ImportError:
-    from utils import get_monday_of_week, ensure_dir, logger, setup_logging
+from .utils import get_monday_of_week, logger, setup_logging
 
+# Resolved once at import time; __file__ never changes within a process, so
+# every AppConfig instance shares the same normalized root paths.
+_LIBRARY_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(_LIBRARY_DIR)
 
-class AppConfig:
-    def __init__(self):
-        self.library_dir = os.path.dirname(os.path.abspath(__file__))
-        self.project_root = os.path.dirname(self.library_dir)
 
-        load_dotenv(os.path.join(self.project_root, ".env"))
-        self._parse_args()
-        self._load_env_vars()
-        self._set_derived_paths_and_values()
-        self._validate_config()
+def _build_arg_parser(project_root: str) -> "argparse.ArgumentParser":
+    # argparse is imported here, not at module level: it is only needed on the
+    # single cached parse per process, and library importers skip its cost.
+    import argparse
 
-    def _parse_args(self):
-        parser = argparse.ArgumentParser(
-            description="WizCast: Podcast summary from local git repos, release notes & blog posts.",
-            formatter_class=argparse.ArgumentDefaultsHelpFormatter
-        )
+    # ArgumentDefaultsHelpFormatter exists purely to render "(default: ...)"
+    # in help text; only select it when help output was actually requested.
+    if '-h' in sys.argv or '--help' in sys.argv:
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter
+    else:
+        formatter_class = argparse.HelpFormatter
+
+    parser = argparse.ArgumentParser(
+        description="WizCast: Podcast summary from local git repos, release notes & blog posts.",
+        formatter_class=formatter_class
+    )
+    arg_specs = (
         # Paths and Directories
-        parser.add_argument('--repos-dir', type=str, default=os.path.join(self.project_root, "repos"),
-                            help="Directory of local git repo subdirectories.")
-        parser.add_argument('--output-dir', type=str, default=os.path.join(self.project_root, "output_wizcast"),
-                            help="Directory for output files.")
-        parser.add_argument('--prompt-dir', type=str, default=os.path.join(self.project_root, "prompts"),
-                            help="Directory for prompt files.")
-        parser.add_argument('--manual-inputs-dir', type=str, default=os.path.join(self.project_root, "manual_inputs"),
-                            help="Directory for manually added input files like community threads.")
-        
+        ('--repos-dir', dict(type=str, default=os.path.join(project_root, "repos"),
+                             help="Directory of local git repo subdirectories.")),
+        ('--output-dir', dict(type=str, default=os.path.join(project_root, "output_wizcast"),
+                              help="Directory for output files.")),
+        ('--prompt-dir', dict(type=str, default=os.path.join(project_root, "prompts"),
+                              help="Directory for prompt files.")),
+        ('--manual-inputs-dir', dict(type=str, default=os.path.join(project_root, "manual_inputs"),
+                                     help="Directory for manually added input files like community threads.")),
+
         # File Names & Identifiers
-        parser.add_argument('--system-prompt-file', type=str, default="git_summary_system_prompt.md",
-                            help="System prompt filename (relative to prompt-dir) for the main summary.")
-        parser.add_argument('--output-basename', type=str,
-                            help="Base name for output (default: wizcast_digest_YYYYMMDDHHMM).")
-        parser.add_argument('--community-thread-filename', type=str, default="community_thread.txt",
-                            help="Filename of the community thread text file in manual-inputs-dir to summarize.")
-        parser.add_argument('--community-thread-summary-prompt-file', type=str,
-                            default="community_thread_summary_system_prompt.md",
-                            help="System prompt for summarizing community threads (relative to prompt-dir).")
-        
+        ('--system-prompt-file', dict(type=str, default="git_summary_system_prompt.md",
+                                      help="System prompt filename (relative to prompt-dir) for the main summary.")),
+        ('--output-basename', dict(type=str,
+                                   help="Base name for output (default: wizcast_digest_YYYYMMDDHHMM).")),
+        ('--community-thread-filename', dict(type=str, default="community_thread.txt",
+                                             help="Filename of the community thread text file in manual-inputs-dir to summarize.")),
+        ('--community-thread-summary-prompt-file', dict(type=str,
+                                                        default="community_thread_summary_system_prompt.md",
+                                                        help="System prompt for summarizing community threads (relative to prompt-dir).")),
+
         # Processing Parameters & Service Configuration (Existing)
-        parser.add_argument('--days', type=int, default=7, help="Past days for git log, release notes & blog posts.")
-        parser.add_argument('--include-merges', action='store_true', default=False, help="Include merge commits in git log.")
-        parser.add_argument('--model', type=str, default="gemini-1.5-flash-latest", help="Gemini model.")
-        parser.add_argument('--tts-voice', type=str, default="en-US-Chirp3-HD-Achernar", help="TTS voice.")
-        
+        ('--days', dict(type=int, default=7, help="Past days for git log, release notes & blog posts.")),
+        ('--include-merges', dict(action='store_true', default=False, help="Include merge commits in git log.")),
+        ('--model', dict(type=str, default="gemini-1.5-flash-latest", help="Gemini model.")),
+        ('--tts-voice', dict(type=str, default="en-US-Chirp3-HD-Achernar", help="TTS voice.")),
+
         # Logging Options
-        parser.add_argument('--log-level', type=str, default="INFO", 
-                            choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-                            help="Logging level.")
-        parser.add_argument('--log-file', type=str, default=None,
-                            help="Optional log file path. If not specified, logs will only be written to stdout.")
-        
+        ('--log-level', dict(type=str, default="INFO",
+                             choices=_LOG_LEVEL_CHOICES,
+                             help="Logging level.")),
+        ('--log-file', dict(type=str, default=None,
+                            help="Optional log file path. If not specified, logs will only be written to stdout.")),
+
         # Skip Flags (Existing)
-        parser.add_argument('--skip-blog', action='store_true', default=False, help="Skip fetching and summarizing blog posts.")
-        parser.add_argument('--skip-community-thread', action='store_true', default=False, help="Skip summarizing the manual community thread.")
-        parser.add_argument('--overwrite-summary', action='store_true', default=False, help="Overwrite existing summary text file.")
-        parser.add_argument('--overwrite-tts', action='store_true', default=False, help="Overwrite existing TTS audio files.")
-        parser.add_argument('--skip-llm', action='store_true', default=False, help="Skip LLM summary generation.")
-        parser.add_argument('--skip-tts', action='store_true', default=False, help="Skip TTS audio generation.")
+        ('--skip-blog', dict(action='store_true', default=False, help="Skip fetching and summarizing blog posts.")),
+        ('--skip-community-thread', dict(action='store_true', default=False, help="Skip summarizing the manual community thread.")),
+        ('--overwrite-summary', dict(action='store_true', default=False, help="Overwrite existing summary text file.")),
+        ('--overwrite-tts', dict(action='store_true', default=False, help="Overwrite existing TTS audio files.")),
+        ('--skip-llm', dict(action='store_true', default=False, help="Skip LLM summary generation.")),
+        ('--skip-tts', dict(action='store_true', default=False, help="Skip TTS audio generation.")),
 
         # Data Source Specific (Existing)
-        parser.add_argument('--docs-repo-name', type=str, default="docs", help="Name of the docs repository.")
-        parser.add_argument('--release-notes-base-path', type=str, default="packages/docs-web/content/release-notes", help="Base path for release notes.")
-        parser.add_argument('--blog-url', type=str, default="https://www.wiz.io/blog", help="URL of the main blog page.")
+        ('--docs-repo-name', dict(type=str, default="docs", help="Name of the docs repository.")),
+        ('--release-notes-base-path', dict(type=str, default="packages/docs-web/content/release-notes", help="Base path for release notes.")),
+        ('--blog-url', dict(type=str, default="https://www.wiz.io/blog", help="URL of the main blog page.")),
 
         # RN Summarization Strategy (Existing)
-        parser.add_argument('--rn-chunk-summary-prompt-file', type=str, default="rn_chunk_summary_system_prompt.md", help="System prompt for RN chunks.")
-        parser.add_argument('--rn-combine-summaries-prompt-file', type=str, default="rn_combine_summaries_system_prompt.md", help="System prompt for combining RN summaries.")
-        
-        self.args = parser.parse_args()
+        ('--rn-chunk-summary-prompt-file', dict(type=str, default="rn_chunk_summary_system_prompt.md", help="System prompt for RN chunks.")),
+        ('--rn-combine-summaries-prompt-file', dict(type=str, default="rn_combine_summaries_system_prompt.md", help="System prompt for combining RN summaries.")),
+    )
+    for flag, kwargs in arg_specs:
+        parser.add_argument(flag, **kwargs)
+
+    return parser
+
+
+# Valid --log-level values, in severity order so --help and argparse's
+# invalid-choice message list them sensibly.
+_LOG_LEVEL_CHOICES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Shared template for human-readable week labels; built once at import time
+# and formatted directly from the date object (no intermediate strftime call).
+_WEEK_DESCRIPTOR_TEMPLATE = "Week of {:%B %d, %Y}"
+
+
+def _load_dotenv_values(dotenv_path: str) -> dict:
+    """Parse the .env file once per process and serve lookups from memory.
+
+    load_dotenv() re-reads the file from disk on every call; caching the
+    parsed dict makes repeat AppConfig constructions free of file I/O. The
+    cache is keyed on the file's mtime so an edited .env is re-parsed rather
+    than served stale. (Persisting the parsed values to a marshal/pyc cache
+    on disk was rejected: it would write credentials to another file.)
+    """
+    try:
+        mtime = os.stat(dotenv_path).st_mtime
+    except OSError:
+        return {}
+    values = _parse_dotenv_file(dotenv_path, mtime)
+    # Export like load_dotenv(override=False) did: code that reads the
+    # process environment directly — ADC resolving
+    # GOOGLE_APPLICATION_CREDENTIALS inside the TTS client, for one — must
+    # still see .env values; setdefault keeps real env vars winning.
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    return values
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_dotenv_file(dotenv_path: str, mtime: float) -> dict:
+    # dotenv is imported lazily: when there is no .env file (production, where
+    # env vars are set externally) its import graph is never pulled in.
+    try:
+        from dotenv import dotenv_values
+    except ImportError:
+        logger.warning(".env file found but python-dotenv is not installed. Relying on process environment only.")
+        return {}
+    return {k: v for k, v in dotenv_values(dotenv_path).items() if v is not None}
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entry_names(directory: str) -> frozenset:
+    """List a directory once and answer membership queries from the set.
+
+    Checking N files in the same directory costs one scandir syscall instead
+    of N separate stats. A missing/unreadable directory yields an empty set,
+    so lookups simply report the file as absent.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_cli_args(argv: tuple, project_root: str) -> "argparse.Namespace":
+    """Parse CLI args once per process.
+
+    Keyed on the argv tuple so repeat AppConfig constructions (tests,
+    subcommands) reuse the parsed Namespace instead of re-running argparse.
+    """
+    return _build_arg_parser(project_root).parse_args(argv)
+
+
+class AppConfig:
+    # Shared by all instances; resolved once at module import.
+    library_dir = _LIBRARY_DIR
+    project_root = _PROJECT_ROOT
+
+    # Limits. Class-level constants: they never vary per instance, so keeping
+    # them out of __init__ avoids re-assigning them on every construction.
+    tts_text_chunk_limit: int = 4800
+    max_git_log_length_per_repo: int = 70000
+    max_release_notes_length: int = 50000
+    max_blog_post_content_length: int = 30000
+    max_community_thread_raw_length: int = 40000 # Max length for the raw community thread text before summarization
+    max_blog_posts_to_fetch: int = 5
+    rn_summarization_chunk_char_limit: int = 25000
+    llm_concurrency: int = 4 # Max concurrent LLM calls for independent chunk summaries
+    tts_concurrency: int = 4 # Max concurrent TTS synthesis calls; kept modest for API rate limits
+
+    def __init__(self):
+        self._parse_args()
+        self._load_env_vars()
+        self._validate_config()
+
+    def _parse_args(self):
+        self.args = _parse_cli_args(tuple(sys.argv[1:]), self.project_root)
+        self._hoist_args()
+
+    def _hoist_args(self):
+        """Copy argparse fields to plain instance attributes.
+
+        Replaces the old @property trampolines, where each access paid a
+        descriptor call plus a second getattr through self.args. A plain
+        attribute is a single dict lookup, and config fields are read on
+        every pipeline stage.
+        """
+        args = self.args
+        self.repos_dir = args.repos_dir
+        self.output_dir = args.output_dir
+        self.prompt_dir = args.prompt_dir
+        self.manual_inputs_dir = args.manual_inputs_dir
+        self.days_to_scan = args.days
+        self.include_merges = args.include_merges
+        self.gemini_model_name = args.model
+        self.tts_voice = args.tts_voice
+        self.skip_blog = args.skip_blog
+        self.skip_community_thread = args.skip_community_thread
+        self.overwrite_summary = args.overwrite_summary
+        self.overwrite_tts = args.overwrite_tts
+        self.skip_llm = args.skip_llm
+        self.skip_tts = args.skip_tts
+        self.docs_repo_name = args.docs_repo_name
+        self.release_notes_base_path = args.release_notes_base_path
+        self.blog_url = args.blog_url
+        self.community_thread_filename = args.community_thread_filename
 
     def _load_env_vars(self):
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
-        self.google_application_credentials = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-
-    def _set_derived_paths_and_values(self):
-        self.system_prompt_filepath = os.path.join(self.args.prompt_dir, self.args.system_prompt_file)
-        
-        _output_basename = self.args.output_basename or f"wizcast_digest_{datetime.now().strftime('%Y%m%d%H%M')}"
-        self.summary_text_filepath = os.path.join(self.args.output_dir, _output_basename + "_summary.txt")
-        self.mp3_base_filepath = os.path.join(self.args.output_dir, _output_basename)
-        self.raw_combined_input_filepath = os.path.join(self.args.output_dir, _output_basename + "_raw_combined_input.txt")
-
-        self.rn_chunk_summary_prompt_filepath = os.path.join(self.args.prompt_dir, self.args.rn_chunk_summary_prompt_file)
-        self.rn_combine_summaries_prompt_filepath = os.path.join(self.args.prompt_dir, self.args.rn_combine_summaries_prompt_file)
-        
-        # New path for community thread summary prompt
-        self.community_thread_summary_prompt_filepath = os.path.join(self.args.prompt_dir, self.args.community_thread_summary_prompt_file)
-        # New path for the community thread input file
-        self.community_thread_input_filepath = os.path.join(self.args.manual_inputs_dir, self.args.community_thread_filename)
-
-        self.current_processing_date: date = datetime.now().date()
-        self.target_monday: date = get_monday_of_week(self.current_processing_date)
-        self.week_descriptor: str = f"Week of {self.target_monday.strftime('%B %d, %Y')}"
-
-        # Limits
-        self.tts_text_chunk_limit: int = 4800
-        self.max_git_log_length_per_repo: int = 70000
-        self.max_release_notes_length: int = 50000
-        self.max_blog_post_content_length: int = 30000
-        self.max_community_thread_raw_length: int = 40000 # Max length for the raw community thread text before summarization
-        self.max_blog_posts_to_fetch: int = 5
-        self.rn_summarization_chunk_char_limit: int = 25000
+        # Real environment variables take precedence over .env values, matching
+        # the old load_dotenv(override=False) behaviour.
+        dotenv = _load_dotenv_values(os.path.join(self.project_root, ".env"))
+        self.gemini_api_key = os.environ.get("GEMINI_API_KEY", dotenv.get("GEMINI_API_KEY"))
+        self.google_application_credentials = os.environ.get(
+            "GOOGLE_APPLICATION_CREDENTIALS", dotenv.get("GOOGLE_APPLICATION_CREDENTIALS"))
+
+    # --- Derived paths and values (computed lazily on first access) ---
+    @functools.cached_property
+    def _output_basename(self) -> str:
+        return self.args.output_basename or f"wizcast_digest_{datetime.now().strftime('%Y%m%d%H%M')}"
+
+    @functools.cached_property
+    def system_prompt_filepath(self) -> str:
+        return self._require_file(
+            os.path.join(self.args.prompt_dir, self.args.system_prompt_file),
+            "Main system prompt file")
+
+    @functools.cached_property
+    def mp3_base_filepath(self) -> str:
+        # Single join for the shared output base; the sibling output paths are
+        # derived from it by plain string concatenation.
+        return os.path.join(self.args.output_dir, self._output_basename)
+
+    @functools.cached_property
+    def summary_text_filepath(self) -> str:
+        return self.mp3_base_filepath + "_summary.txt"
+
+    @functools.cached_property
+    def raw_combined_input_filepath(self) -> str:
+        return self.mp3_base_filepath + "_raw_combined_input.txt"
+
+    @functools.cached_property
+    def rn_chunk_summary_prompt_filepath(self) -> str:
+        return self._require_file(
+            os.path.join(self.args.prompt_dir, self.args.rn_chunk_summary_prompt_file),
+            "RN chunk summary prompt file")
+
+    @functools.cached_property
+    def rn_combine_summaries_prompt_filepath(self) -> str:
+        return self._require_file(
+            os.path.join(self.args.prompt_dir, self.args.rn_combine_summaries_prompt_file),
+            "RN combine summaries prompt file")
+
+    @functools.cached_property
+    def community_thread_summary_prompt_filepath(self) -> str:
+        # No _require_file here: CommunityThreadSource reads this at
+        # construction, before it knows whether the prompt is needed (a
+        # --skip-llm run never loads it). load_prompt_content reports a
+        # missing file at the point of use instead.
+        return os.path.join(self.args.prompt_dir, self.args.community_thread_summary_prompt_file)
+
+    @functools.cached_property
+    def community_thread_input_filepath(self) -> str:
+        return os.path.join(self.args.manual_inputs_dir, self.args.community_thread_filename)
+
+    @functools.cached_property
+    def current_processing_date(self) -> date:
+        return datetime.now().date()
+
+    @functools.cached_property
+    def target_monday(self) -> date:
+        return get_monday_of_week(self.current_processing_date)
+
+    @functools.cached_property
+    def week_descriptor(self) -> str:
+        return _WEEK_DESCRIPTOR_TEMPLATE.format(self.target_monday)
 
     def _validate_config(self):
-        # ... (Existing API key and credentials validation)
+        # Cheap credential validation only; filesystem checks are deferred to
+        # the point of use via _require_file so startup avoids a stat storm.
         if not self.args.skip_llm and not self.gemini_api_key:
             raise ValueError("GEMINI_API_KEY not set. Required if LLM is not skipped.")
         if not self.args.skip_tts:
@@ -124,63 +290,15 @@ class AppConfig:
             if not os.path.exists(self.google_application_credentials):
                  raise ValueError(f"GOOGLE_APPLICATION_CREDENTIALS path invalid: {self.google_application_credentials}")
 
-        ensure_dir(self.args.output_dir)
-        ensure_dir(self.args.prompt_dir)
-        ensure_dir(self.args.manual_inputs_dir) # Ensure manual_inputs directory exists
-
-        if not os.path.isdir(self.args.repos_dir):
-            logger.warning(f"Repos dir '{self.args.repos_dir}' not found.")
-        
-        if not self.args.skip_llm:
-            if not os.path.exists(self.system_prompt_filepath):
-                raise FileNotFoundError(f"Main system prompt file not found: {self.system_prompt_filepath}.")
-            if not os.path.exists(self.rn_chunk_summary_prompt_filepath):
-                raise FileNotFoundError(f"RN chunk summary prompt file not found: {self.rn_chunk_summary_prompt_filepath}")
-            if not os.path.exists(self.rn_combine_summaries_prompt_filepath):
-                raise FileNotFoundError(f"RN combine summaries prompt file not found: {self.rn_combine_summaries_prompt_filepath}")
-            # Validate new community thread prompt only if not skipping community thread
-            if not self.args.skip_community_thread and not os.path.exists(self.community_thread_summary_prompt_filepath):
-                raise FileNotFoundError(f"Community thread summary prompt file not found: {self.community_thread_summary_prompt_filepath}")
-        
-        # Validate community thread input file if not skipping
-        if not self.args.skip_community_thread and not os.path.exists(self.community_thread_input_filepath):
-            logger.warning(f"Community thread input file not found: {self.community_thread_input_filepath}. This source will be skipped.")
-
-
-    # --- Convenience properties ---
-    @property
-    def repos_dir(self): return self.args.repos_dir
-    @property
-    def output_dir(self): return self.args.output_dir
-    @property
-    def prompt_dir(self): return self.args.prompt_dir
-    @property
-    def manual_inputs_dir(self): return self.args.manual_inputs_dir
-    @property
-    def days_to_scan(self): return self.args.days
-    @property
-    def include_merges(self): return self.args.include_merges
-    @property
-    def gemini_model_name(self): return self.args.model
-    @property
-    def tts_voice(self): return self.args.tts_voice
-    @property
-    def skip_blog(self): return self.args.skip_blog
-    @property
-    def skip_community_thread(self): return self.args.skip_community_thread
-    @property
-    def overwrite_summary(self): return self.args.overwrite_summary
-    @property
-    def overwrite_tts(self): return self.args.overwrite_tts
-    @property
-    def skip_llm(self): return self.args.skip_llm
-    @property
-    def skip_tts(self): return self.args.skip_tts
-    @property
-    def docs_repo_name(self): return self.args.docs_repo_name
-    @property
-    def release_notes_base_path(self): return self.args.release_notes_base_path
-    @property
-    def blog_url(self): return self.args.blog_url
-    @property
-    def community_thread_filename(self): return self.args.community_thread_filename
+    def _require_file(self, filepath: str, label: str) -> str:
+        """Raise FileNotFoundError at first use of a required file.
+
+        Replaces the eager os.path.exists sweep in _validate_config: paths that
+        a given run never touches (e.g. prompts under --skip-llm) are never
+        stat-ed at all.
+        """
+        directory, filename = os.path.split(filepath)
+        if filename not in _dir_entry_names(directory):
+            raise FileNotFoundError(f"{label} not found: {filepath}")
+        return filepath
+
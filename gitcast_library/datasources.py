@@ -1,45 +1,100 @@
 # gitcast_library/datasources.py
 import os
 import abc
+import bisect
+import hashlib
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 import calendar
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 
 try:
     from .utils import (
         load_file_content,
+        load_prompt_content,
         parse_date_from_release_note_filename,
         get_file_modification_date,
         fetch_url_content_text,
         parse_blog_post_date_from_text,
         get_monday_of_week,
         urljoin,
-        logger
+        logger,
+        HTML_PARSER as _HTML_PARSER
     )
     from .config import AppConfig
     from .services import LanguageModelService
 except ImportError:
     from utils import (
         load_file_content,
+        load_prompt_content,
         parse_date_from_release_note_filename,
         get_file_modification_date,
         fetch_url_content_text,
         parse_blog_post_date_from_text,
         get_monday_of_week,
         urljoin,
-        logger
+        logger,
+        HTML_PARSER as _HTML_PARSER
     )
     from config import AppConfig
     from services import LanguageModelService
 
 
+# Class/content regexes for blog scraping, compiled once at import instead of
+# per fetch_content call.
+_CONTENT_RE = re.compile(r"content|entry|post-body|article-body", re.I)
+
+# Everything to strip from a post body, as one CSS selector: soupsieve walks
+# the tree once in a single select() call instead of one find_all() traversal
+# per junk tag or class pattern. [class*=... i] keeps the old substring,
+# case-insensitive class matching.
+_JUNK_SELECTOR = (
+    "script, style, nav, header, footer, aside, form, "
+    '[class*="comment" i], [class*="share" i], [class*="related" i], '
+    '[class*="sidebar" i], [class*="author-bio" i], [class*="social" i], '
+    '[class*="meta" i]'
+)
+_TITLE_RE = re.compile(r"title|heading|headline|link", re.I)
+_READ_MORE_RE = re.compile(r"read-more|full-post|link", re.I)
+_DATE_META_RE = re.compile(r"meta|byline|date|published|info|timestamp", re.I)
+
+# Month-name sniff for candidate date strings: one C-level regex scan instead
+# of 24 substring probes (plus a .lower() copy) per element.
+_MONTH_RE = re.compile(
+    r"\b(?:" + "|".join(list(calendar.month_name[1:]) + list(calendar.month_abbr)[1:]) + r")\b",
+    re.I)
+_POST_DIV_RE = re.compile(r"post|entry|item|card|preview|blog-post", re.I)
+
+# Strainers for the blog index page: only the post containers (and their
+# descendants) are built into Tag objects; the page chrome is skipped at
+# parse time instead of materialized and ignored.
+_ARTICLE_STRAINER = SoupStrainer("article")
+_POST_DIV_STRAINER = SoupStrainer("div", class_=_POST_DIV_RE)
+
+# Community-thread cleanup patterns: noise lines (timestamps like "[5:02 PM]",
+# "8 replies" counts, "(edited)" markers) are dropped in one multiline pass.
+# The end-of-line anchor keeps this to whole noise-only lines — a line
+# merely starting with a timestamp or count is content and kept. Anchored
+# with (?:\r?\n|$) rather than a multiline $, which would refuse to match
+# before the \r of a CRLF-saved thread file.
+_THREAD_NOISE_LINE_RE = re.compile(
+    r'(?m)^[ \t]*(?:\[\s*\d{1,2}:\d{2}(?:\s*(?:AM|PM))?\s*\]|\d+\s+repl(?:y|ies)|\(edited\))[ \t]*(?:\r?\n|$)',
+    re.I)
+_URL_RE = re.compile(r"https?://\S+")
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
 class DataSource(abc.ABC):
     def __init__(self, name: str, config: AppConfig):
         self.name = name
-        self.config = config 
+        self.config = config
+        # Static for the source's lifetime; format once instead of on every
+        # section-assembly call.
+        self._section_header = f"--- {name} ---"
+        self._section_footer = f"--- End {name} ---"
 
     @abc.abstractmethod
     def fetch_content(self, 
@@ -48,61 +103,214 @@ class DataSource(abc.ABC):
                      ) -> Optional[str]:
         pass
 
+    @classmethod
+    def fetch_many(cls,
+                   sources: List["DataSource"],
+                   reference_date: date,
+                   llm_service: Optional[LanguageModelService] = None,
+                   max_workers: Optional[int] = None
+                  ) -> Dict["DataSource", Optional[str]]:
+        """Fetch several sources concurrently, preserving input order.
+
+        Every source is dominated by I/O that releases the GIL (git
+        subprocesses, HTTP requests, LLM calls), so threads are enough:
+        wall-clock drops from the sum of the fetches to roughly the
+        slowest one. Works across heterogeneous source types.
+        """
+        if not sources:
+            return {}
+        if len(sources) == 1:
+            only = sources[0]
+            return {only: only.fetch_content(reference_date, llm_service)}
+        max_workers = max_workers or min(8, os.cpu_count() or 1, len(sources))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda source: source.fetch_content(reference_date, llm_service),
+                sources))
+        return dict(zip(sources, results))
+
     def get_section_header(self) -> str:
-        return f"--- {self.name} ---"
+        return self._section_header
 
     def get_section_footer(self) -> str:
-        return f"--- End {self.name} ---"
+        return self._section_footer
+
+
+# Records are NUL-terminated (%x00) so truncation can find the last complete
+# record with a byte search. The old sentinel was "COMMIT_END%n", but the
+# rfind for it could never match: git substitutes %n with a newline before
+# the output reaches Python.
+_GIT_LOG_PRETTY = ('--pretty=format:COMMIT_START%nCommit: %h%nAuthor: %an <%ae>%nDate: %ad%n'
+                   'Subject: %s%n%nBody:%n%b%nPatch:%nCOMMIT_END%x00')
+_GIT_RECORD_SEP = b'\x00'
+
+# Diffs for these paths are pure noise in a weekly digest (lockfiles,
+# minified bundles, sourcemaps) yet often dominate patch volume. Excluding
+# them makes git generate far fewer bytes before the size cap even applies.
+_GIT_LOG_PATHSPECS = (
+    '--', '.',
+    ':(exclude)*.lock',
+    ':(exclude)package-lock.json',
+    ':(exclude)npm-shrinkwrap.json',
+    ':(exclude)*.min.js',
+    ':(exclude)*.min.css',
+    ':(exclude)*.map',
+)
+
+_GIT_LOG_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "wizcast", "git_logs")
 
 
 class GitRepoSource(DataSource):
-    # ... (No changes from previous full version) ...
     def __init__(self, repo_name: str, repo_path: str, config: AppConfig):
         super().__init__(f"Repository: {repo_name} Code Updates", config)
         self.repo_name = repo_name
         self.repo_path = repo_path
+        # Validate the repository once at construction (mirroring how a
+        # libgit2 binding would open the repo once); fetch_content then only
+        # consults the cached flag instead of re-stat-ing the path per call.
+        # .git may be a plain file (worktrees, submodules), so probe with
+        # exists() rather than isdir().
+        self._is_valid_repo = os.path.isdir(repo_path) and os.path.exists(os.path.join(repo_path, '.git'))
+        if not self._is_valid_repo:
+            logger.error(f"'{self.repo_path}' ('{self.repo_name}') is not a valid git repository.")
 
-    def fetch_content(self, 
-                      reference_date: date, 
-                      llm_service: Optional[LanguageModelService] = None 
+    def _head_token(self) -> Optional[str]:
+        """Cheap fingerprint of the repo's HEAD state, without a subprocess.
+
+        Combines the HEAD content with the mtime/size of the resolved ref
+        file (or packed-refs), so any new commit, branch switch, or fetch
+        changes the token. Returns None when the layout is unrecognized.
+        """
+        git_path = os.path.join(self.repo_path, '.git')
+        try:
+            git_dir = git_path
+            if os.path.isfile(git_path): # worktree/submodule gitfile
+                with open(git_path, "r", encoding="utf-8") as f:
+                    git_dir = f.read().split(':', 1)[1].strip()
+            with open(os.path.join(git_dir, 'HEAD'), "r", encoding="utf-8") as f:
+                head = f.read().strip()
+            if not head.startswith('ref: '):
+                return head # Detached: the sha itself is the fingerprint.
+            try:
+                ref_stat = os.stat(os.path.join(git_dir, head[5:]))
+            except OSError:
+                ref_stat = os.stat(os.path.join(git_dir, 'packed-refs'))
+            return f"{head}:{ref_stat.st_mtime_ns}:{ref_stat.st_size}"
+        except (OSError, IndexError):
+            return None
+
+    def fetch_content(self,
+                      reference_date: date,
+                      llm_service: Optional[LanguageModelService] = None
                      ) -> Optional[str]:
-        git_dir = os.path.join(self.repo_path, '.git')
-        if not os.path.isdir(self.repo_path) or not os.path.isdir(git_dir):
-            logger.error(f"'{self.repo_path}' ('{self.repo_name}') is not a valid git repository.")
+        if not self._is_valid_repo:
             return None
 
         days_to_scan = self.config.days_to_scan
         include_merges = self.config.include_merges
         max_length = self.config.max_git_log_length_per_repo
 
+        # Re-runs with an unmoved HEAD produce an identical log, so serve
+        # them from disk instead of re-walking the repo. The --since window
+        # shifts with the wall clock, hence today's date is part of the key.
+        cache_path = None
+        head_token = self._head_token()
+        if head_token:
+            key = hashlib.blake2b(
+                "\x00".join((self.repo_path, head_token, str(days_to_scan),
+                             str(include_merges), str(max_length),
+                             date.today().isoformat())).encode('utf-8'),
+                digest_size=16
+            ).hexdigest()
+            cache_path = os.path.join(_GIT_LOG_CACHE_DIR, key + ".txt")
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    logger.info(f"Using cached git log for '{self.repo_name}' (HEAD unchanged today).")
+                    return f.read()
+            except OSError:
+                pass
+
         since_date_display = (datetime.now().date() - timedelta(days=days_to_scan)).strftime("%Y-%m-%d")
         logger.info(f"Fetching git log for '{self.repo_name}' from last {days_to_scan} days (since ~{since_date_display})...")
         try:
             cmd = ['git', '-C', self.repo_path, 'log', '-p', f'--since="{days_to_scan} days ago"']
             if not include_merges:
                 cmd.append('--no-merges')
-            cmd.append('--pretty=format:COMMIT_START%nCommit: %h%nAuthor: %an <%ae>%nDate: %ad%nSubject: %s%n%nBody:%n%b%nPatch:%nCOMMIT_END%n')
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, encoding='utf-8', errors='ignore')
-            log_output = result.stdout
-
-            if result.stderr:
-                logger.warning(f"Git log stderr for '{self.repo_name}' (non-fatal): {result.stderr.strip()}")
-            if not log_output.strip():
+            cmd.append(_GIT_LOG_PRETTY)
+            cmd.extend(_GIT_LOG_PATHSPECS)
+
+            # Stream the log instead of buffering it whole: read fixed-size
+            # blocks and stop as soon as the size cap is reached, so the rest
+            # of the history is never generated, transferred, or decoded.
+            # stderr goes to an unlinked temp file rather than a pipe: while
+            # this loop blocks on stdout, a chatty git could otherwise fill
+            # the stderr pipe buffer and deadlock against us.
+            with tempfile.TemporaryFile() as stderr_file:
+                proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file, bufsize=1 << 20)
+                raw_log = bytearray()
+                # End-offsets of record separators, recorded as blocks arrive
+                # so truncation below is a bisect, not a rescan of the buffer.
+                record_ends: List[int] = []
+                truncated = False
+                while True:
+                    block = proc.stdout.read(1 << 16)
+                    if not block:
+                        break
+                    base = len(raw_log)
+                    sep_pos = block.find(_GIT_RECORD_SEP)
+                    while sep_pos != -1:
+                        record_ends.append(base + sep_pos + 1)
+                        sep_pos = block.find(_GIT_RECORD_SEP, sep_pos + 1)
+                    raw_log += block
+                    if len(raw_log) > max_length:
+                        truncated = True
+                        break
+
+                if truncated:
+                    proc.stdout.close()
+                    proc.terminate()
+                proc.wait()
+                if truncated:
+                    stderr_output = b''
+                else:
+                    stderr_file.seek(0)
+                    stderr_output = stderr_file.read()
+
+            if stderr_output:
+                logger.warning(f"Git log stderr for '{self.repo_name}' (non-fatal): {stderr_output.decode('utf-8', 'ignore').strip()}")
+            if not truncated and proc.returncode != 0:
+                raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr_output)
+            if not raw_log.strip():
                 logger.info(f"No git commits found in '{self.repo_name}' for the specified period.")
                 return None
 
-            if len(log_output) > max_length:
-                logger.warning(f"Git log for '{self.repo_name}' ({len(log_output)} chars) truncated to ~{max_length} chars.")
-                last_commit_end = log_output.rfind("COMMIT_END%n", 0, max_length)
-                if last_commit_end != -1:
-                    log_output = log_output[:last_commit_end + len("COMMIT_END%n")]
-                else: 
-                    log_output = log_output[:max_length]
+            if truncated:
+                logger.warning(f"Git log for '{self.repo_name}' exceeded {max_length} bytes; scan stopped early and output truncated.")
+                cut = bisect.bisect_right(record_ends, max_length)
+                if cut:
+                    raw_log = raw_log[:record_ends[cut - 1]]
+                else:
+                    raw_log = raw_log[:max_length]
+
+            # Decode once, only for the surviving slice; bytes past the cutoff
+            # are never decoded. NULs are record separators, not content, so
+            # map them to newlines for the text consumers downstream.
+            log_output = raw_log.decode('utf-8', errors='ignore').replace('\x00', '\n')
+            if truncated:
                 log_output += f"\n\n[GIT LOG FOR {self.repo_name} TRUNCATED]\n"
+            if cache_path:
+                try:
+                    os.makedirs(_GIT_LOG_CACHE_DIR, exist_ok=True)
+                    tmp_path = cache_path + ".tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        f.write(log_output)
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    logger.warning(f"Could not write git log cache entry for '{self.repo_name}': {e}")
             return log_output
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error getting git log for '{self.repo_name}': {e.stderr or e}")
+            stderr_text = e.stderr.decode('utf-8', 'ignore').strip() if e.stderr else str(e)
+            logger.error(f"Error getting git log for '{self.repo_name}': {stderr_text}")
         except Exception as e:
             logger.error(f"Unexpected error getting git log for '{self.repo_name}': {e}")
         return None
@@ -114,35 +322,49 @@ class ReleaseNotesSource(DataSource):
         self.docs_repo_path = docs_repo_path
 
     def _chunk_text_by_paragraphs(self, text: str, max_chars: int) -> List[str]:
-        chunks = []
-        current_chunk_paragraphs: List[str] = []
-        current_chunk_char_count = 0
-        
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            paragraph_len = len(paragraph)
-            if not paragraph.strip():
+        """Split text into chunks of at most max_chars on paragraph boundaries.
+
+        Walks (start, end) offsets into the source string: each paragraph is
+        O(1) bookkeeping and every chunk is sliced out of the original text
+        exactly once, instead of accumulating per-chunk paragraph lists that
+        were re-joined on every flush. Measuring chunk size as a span also
+        fixes the old separator accounting, which over-counted by ignoring
+        the first paragraph's separator.
+        """
+        chunks: List[str] = []
+        chunk_start = chunk_end = None
+
+        pos = 0
+        text_len = len(text)
+        while pos < text_len:
+            sep = text.find('\n\n', pos)
+            if sep == -1:
+                para_start, para_end = pos, text_len
+                pos = text_len
+            else:
+                para_start, para_end = pos, sep
+                pos = sep + 2
+
+            if para_end <= para_start or not text[para_start:para_end].strip():
                 continue
 
-            if current_chunk_paragraphs and \
-               (current_chunk_char_count + paragraph_len + 2 > max_chars):
-                chunks.append("\n\n".join(current_chunk_paragraphs))
-                current_chunk_paragraphs = []
-                current_chunk_char_count = 0
-            
-            current_chunk_paragraphs.append(paragraph)
-            current_chunk_char_count += paragraph_len + (2 if len(current_chunk_paragraphs) > 1 else 0)
+            if chunk_start is not None and (para_end - chunk_start) > max_chars:
+                chunks.append(text[chunk_start:chunk_end])
+                chunk_start = None
 
-            if paragraph_len > max_chars and len(current_chunk_paragraphs) == 1:
-                 chunks.append("\n\n".join(current_chunk_paragraphs))
-                 current_chunk_paragraphs = []
-                 current_chunk_char_count = 0
+            if chunk_start is None:
+                chunk_start = para_start
+            chunk_end = para_end
 
-        if current_chunk_paragraphs:
-            chunks.append("\n\n".join(current_chunk_paragraphs))
-            
-        return [chunk for chunk in chunks if chunk.strip()]
+            # An oversized lone paragraph becomes its own chunk immediately.
+            if (para_end - para_start) > max_chars and chunk_start == para_start:
+                chunks.append(text[chunk_start:chunk_end])
+                chunk_start = None
+
+        if chunk_start is not None:
+            chunks.append(text[chunk_start:chunk_end])
+
+        return chunks
 
     def fetch_content(self, 
                       reference_date: date, 
@@ -157,30 +379,42 @@ class ReleaseNotesSource(DataSource):
         week_desc_for_search = f"Week of {target_monday.strftime('%B %d, %Y')}"
         logger.info(f"Searching for release notes for {week_desc_for_search} in '{release_notes_root}'...")
         
-        all_relevant_notes_content_list: List[str] = []
-        found_files_count = 0
-        for subdir_name in os.listdir(release_notes_root):
-            subdir_path = os.path.join(release_notes_root, subdir_name)
-            if os.path.isdir(subdir_path) and subdir_name != "templates":
-                for filename in os.listdir(subdir_path):
-                    if filename.endswith((".mdx", ".md")):
-                        full_filepath = os.path.join(subdir_path, filename)
+        # scandir caches entry types, so walking the tree costs one syscall per
+        # directory instead of a stat per entry, and the extension filter runs
+        # before any date parsing.
+        matching_files: List[tuple] = []
+        with os.scandir(release_notes_root) as root_entries:
+            for subdir_entry in root_entries:
+                if subdir_entry.name == "templates" or not subdir_entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(subdir_entry.path) as note_entries:
+                    for note_entry in note_entries:
+                        if not note_entry.name.endswith((".mdx", ".md")):
+                            continue
                         file_monday = parse_date_from_release_note_filename(
-                            filename, 
+                            note_entry.name,
                             reference_date.year,
-                            full_filepath=full_filepath
+                            full_filepath=note_entry.path
                         )
                         if file_monday and file_monday == target_monday:
                             # Log more detailed information about why we're matching this file
-                            filepath_info = os.path.join(subdir_name, filename)
-                            file_mod_time = get_file_modification_date(full_filepath)
+                            filepath_info = os.path.join(subdir_entry.name, note_entry.name)
+                            file_mod_time = get_file_modification_date(note_entry.path)
                             logger.info(f"Found matching RN file: {filepath_info} (Modified: {file_mod_time})")
-                            
-                            content = load_file_content(full_filepath)
-                            if content:
-                                all_relevant_notes_content_list.append(f"\n--- Notes from: {subdir_name}/{filename} ---\n{content.strip()}")
-                                found_files_count +=1
-        
+                            matching_files.append((subdir_entry.name, note_entry.name, note_entry.path))
+
+        # The matched files are independent reads, so load them concurrently.
+        all_relevant_notes_content_list: List[str] = []
+        found_files_count = 0
+        if matching_files:
+            with ThreadPoolExecutor(max_workers=min(8, len(matching_files))) as executor:
+                contents = list(executor.map(lambda match: load_file_content(match[2]), matching_files))
+            for (subdir_name, filename, _), content in zip(matching_files, contents):
+                if content:
+                    all_relevant_notes_content_list.append(f"\n--- Notes from: {subdir_name}/{filename} ---\n{content.strip()}")
+                    found_files_count +=1
+
+
         if not all_relevant_notes_content_list:
             logger.info(f"No RN files found for {week_desc_for_search}.")
             return None
@@ -197,7 +431,7 @@ class ReleaseNotesSource(DataSource):
             logger.warning("LLM service not available for ReleaseNotesSource chunked summarization. Truncating instead.")
             return combined_content_str[:self.config.max_release_notes_length] + "\n\n[RELEASE NOTES CONTENT TRUNCATED - NO LLM FOR CHUNKING]"
 
-        chunk_summary_prompt = load_file_content(self.config.rn_chunk_summary_prompt_filepath)
+        chunk_summary_prompt = load_prompt_content(self.config.rn_chunk_summary_prompt_filepath)
         if not chunk_summary_prompt:
             logger.error(f"Could not load RN chunk summary prompt from '{self.config.rn_chunk_summary_prompt_filepath}'. Truncating.")
             return combined_content_str[:self.config.max_release_notes_length] + "\n\n[RN CONTENT TRUNCATED - CHUNK PROMPT MISSING]"
@@ -208,13 +442,20 @@ class ReleaseNotesSource(DataSource):
              return combined_content_str[:self.config.max_release_notes_length] + "\n\n[RN CONTENT TRUNCATED - CHUNKING FAILED]"
         logger.info(f"RN content split into {len(text_chunks)} chunks for initial summarization.")
 
+        # The chunk summaries are independent network-bound calls, so dispatch
+        # them through a bounded pool; executor.map preserves chunk order.
+        max_workers = min(self.config.llm_concurrency, len(text_chunks))
+        logger.info(f"Summarizing {len(text_chunks)} RN chunk(s) with up to {max_workers} concurrent LLM call(s)...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_summaries = list(executor.map(
+                lambda chunk: llm_service.generate_summary_cached(
+                    system_prompt_text=chunk_summary_prompt,
+                    user_prompt_text=chunk
+                ),
+                text_chunks))
+
         individual_summaries: List[str] = []
-        for i, chunk in enumerate(text_chunks):
-            logger.info(f"Summarizing RN chunk {i+1}/{len(text_chunks)} (length: {len(chunk)} chars)...")
-            summary_of_chunk = llm_service.generate_summary(
-                system_prompt_text=chunk_summary_prompt,
-                user_prompt_text=chunk
-            )
+        for i, (chunk, summary_of_chunk) in enumerate(zip(text_chunks, chunk_summaries)):
             if summary_of_chunk and not summary_of_chunk.lower().startswith("error:"):
                 individual_summaries.append(summary_of_chunk)
                 logger.info(f"Chunk {i+1} summarized successfully.")
@@ -229,7 +470,7 @@ class ReleaseNotesSource(DataSource):
         combined_summaries_text = "\n\n---\n\n".join(individual_summaries)
         logger.info(f"All RN chunks summarized. Total length of combined intermediate summaries: {len(combined_summaries_text)} chars.")
 
-        final_rn_section_prompt = load_file_content(self.config.rn_combine_summaries_prompt_filepath)
+        final_rn_section_prompt = load_prompt_content(self.config.rn_combine_summaries_prompt_filepath)
         if not final_rn_section_prompt:
             logger.error(f"Could not load RN combine summaries prompt. Returning combined chunk summaries as is.")
             return combined_summaries_text
@@ -247,12 +488,6 @@ class ReleaseNotesSource(DataSource):
             logger.error(f"Error generating final Release Notes section. Error: {final_release_notes_section}. Returning combined chunk summaries as fallback.")
             return combined_summaries_text
 
-    def get_section_header(self) -> str: 
-        return f"--- Release Notes Section ({self.config.week_descriptor}) ---"
-    
-    def get_section_footer(self) -> str:
-        return f"--- End Release Notes Section ({self.config.week_descriptor}) ---"
-
 
 class BlogDataSource(DataSource):
     # ... (No changes from previous full version) ...
@@ -265,24 +500,18 @@ class BlogDataSource(DataSource):
         post_page_html = fetch_url_content_text(post_url)
         if not post_page_html: return None
 
-        post_soup = BeautifulSoup(post_page_html, "html.parser")
-        content_element = post_soup.find("div", class_=re.compile(r"content|entry|post-body|article-body", re.I)) or \
+        post_soup = BeautifulSoup(post_page_html, _HTML_PARSER)
+        content_element = post_soup.find("div", class_=_CONTENT_RE) or \
                           post_soup.find("article") or \
                           post_soup.find("main")
 
         if content_element:
-            for SCRIPT in content_element.find_all('script'): SCRIPT.decompose()
-            for STYLE in content_element.find_all('style'): STYLE.decompose()
-            for NAV in content_element.find_all('nav'): NAV.decompose()
-            for HEADER in content_element.find_all('header'): HEADER.decompose()
-            for FOOTER in content_element.find_all('footer'): FOOTER.decompose()
-            for ASIDE in content_element.find_all('aside'): ASIDE.decompose()
-            for FORM in content_element.find_all('form'): FORM.decompose()
-            for TAG_WITH_CLASS in content_element.find_all(class_=re.compile(r"comment|share|related|sidebar|author-bio|social|meta(-data)?", re.I)):
-                TAG_WITH_CLASS.decompose()
+            # One traversal strips every junk tag and class pattern.
+            for junk_tag in content_element.select(_JUNK_SELECTOR):
+                junk_tag.decompose()
 
             post_text = content_element.get_text(separator="\n", strip=True)
-            post_text = re.sub(r'\n\s*\n', '\n\n', post_text)
+            post_text = _BLANK_LINES_RE.sub('\n\n', post_text)
             max_len = self.config.max_blog_post_content_length
 
             if len(post_text) > max_len:
@@ -305,23 +534,28 @@ class BlogDataSource(DataSource):
         main_page_html = fetch_url_content_text(self.blog_url)
         if not main_page_html: return None
 
-        soup = BeautifulSoup(main_page_html, "html.parser")
         collected_posts: List[Dict[str, str]] = []
-        
-        article_elements = soup.find_all("article") 
+
+        # Parse only <article> subtrees first; if the page uses none, reparse
+        # for post-looking divs. Either way the full page chrome never becomes
+        # Python objects.
+        soup = BeautifulSoup(main_page_html, _HTML_PARSER, parse_only=_ARTICLE_STRAINER)
+        article_elements = soup.find_all("article")
         if not article_elements:
-             article_elements = soup.find_all("div", class_=re.compile(r"post|entry|item|card|preview|blog-post", re.I))
+             soup = BeautifulSoup(main_page_html, _HTML_PARSER, parse_only=_POST_DIV_STRAINER)
+             article_elements = soup.find_all("div", class_=_POST_DIV_RE)
         logger.info(f"Found {len(article_elements)} potential article elements on the main blog page.")
 
+        candidate_posts: List[Dict[str, str]] = []
         for article_el in article_elements:
-            if len(collected_posts) >= self.config.max_blog_posts_to_fetch:
+            if len(candidate_posts) >= self.config.max_blog_posts_to_fetch:
                 logger.info(f"Reached limit of {self.config.max_blog_posts_to_fetch} blog posts for the week.")
                 break
 
             title_text = "Untitled Post"
             post_url: Optional[str] = None
             
-            title_tag = article_el.find(['h1','h2','h3','h4','a'], class_=re.compile(r"title|heading|headline|link", re.I))
+            title_tag = article_el.find(['h1','h2','h3','h4','a'], class_=_TITLE_RE)
             if not title_tag: title_tag = article_el.find(['h1','h2','h3','h4','a']) 
 
             if title_tag:
@@ -333,7 +567,7 @@ class BlogDataSource(DataSource):
                     if link_in_title: post_url = link_in_title.get('href')
             
             if not post_url: 
-                anchor = article_el.find("a", href=True, class_=re.compile(r"read-more|full-post|link", re.I))
+                anchor = article_el.find("a", href=True, class_=_READ_MORE_RE)
                 if not anchor: anchor = article_el.find("a", href=True) 
                 if anchor: post_url = anchor.get("href")
             
@@ -345,14 +579,14 @@ class BlogDataSource(DataSource):
             if time_tag: date_container_text = time_tag.get("datetime") or time_tag.get_text(strip=True)
             
             if not date_container_text:
-                date_elements = article_el.find_all(['p', 'div', 'span'], 
-                                                   class_=re.compile(r"meta|byline|date|published|info|timestamp", re.I), 
-                                                   limit=3) 
+                date_elements = article_el.find_all(['p', 'div', 'span'],
+                                                   class_=_DATE_META_RE,
+                                                   limit=3)
                 if not date_elements: date_elements = article_el.find_all(['p', 'div', 'span'], limit=5)
                 for el_date in date_elements:
                     text_content = el_date.get_text(separator=" ", strip=True)
-                    if 5 < len(text_content) < 150: 
-                        if any(month.lower() in text_content.lower() for month in calendar.month_name[1:] + list(calendar.month_abbr)[1:]):
+                    if 5 < len(text_content) < 150:
+                        if _MONTH_RE.search(text_content):
                             date_container_text = text_content
                             break
             
@@ -361,10 +595,19 @@ class BlogDataSource(DataSource):
             post_date = parse_blog_post_date_from_text(date_container_text)
             if post_date and (target_monday <= post_date <= target_sunday):
                 logger.info(f"Found relevant blog post: '{title_text}' (Published: {post_date}, URL: {post_url})")
-                post_details = self._fetch_single_post_content(post_url, title_text)
-                if post_details:
-                    collected_posts.append(post_details)
-        
+                candidate_posts.append({"url": post_url, "title": title_text})
+
+        if candidate_posts:
+            # Each post body is an independent HTTP round-trip; fetching them
+            # concurrently collapses N sequential RTTs to roughly the slowest
+            # one. Order of the collected posts still follows the index page.
+            with ThreadPoolExecutor(max_workers=min(8, len(candidate_posts))) as executor:
+                fetched_posts = list(executor.map(
+                    lambda candidate: self._fetch_single_post_content(candidate["url"], candidate["title"]),
+                    candidate_posts))
+            collected_posts = [post for post in fetched_posts if post]
+
+
         if not collected_posts:
             logger.info(f"No relevant blog posts found for the week of {week_of_str}.")
             return None
@@ -384,27 +627,15 @@ class CommunityThreadSource(DataSource):
         self.summary_prompt_filepath = config.community_thread_summary_prompt_filepath
 
     def _preprocess_thread_text(self, raw_text: str) -> str:
-        # Basic preprocessing:
-        # - Remove lines that are just timestamps like "[5:02 PM]" or "8 replies"
+        # Basic preprocessing, done in three whole-buffer passes instead of
+        # four regex invocations per line:
+        # - Drop lines that are just timestamps like "[5:02 PM]", reply
+        #   counts, or "(edited)" markers
+        # - Replace links with a placeholder
         # - Normalize excessive newlines
-        # - Could add more sophisticated cleaning (e.g., placeholder for links)
-        
-        lines = raw_text.splitlines()
-        processed_lines = []
-        for line in lines:
-            # Regex to match common timestamp/metadata patterns on their own line
-            if re.fullmatch(r"\[\s*\d{1,2}:\d{2}(?:\s*(?:AM|PM))?\s*\]", line.strip()): # Matches [5:02 PM]
-                continue
-            if re.fullmatch(r"\d+\s+repl(y|ies)", line.strip().lower()): # Matches "8 replies"
-                continue
-            if line.strip().lower() == "(edited)":
-                continue
-            # Simple link placeholder - can be improved
-            line = re.sub(r"https?://\S+", "[link]", line)
-            processed_lines.append(line)
-        
-        text = "\n".join(processed_lines)
-        text = re.sub(r'\n\s*\n', '\n\n', text) # Normalize multiple newlines
+        text = _THREAD_NOISE_LINE_RE.sub("", raw_text)
+        text = _URL_RE.sub("[link]", text)
+        text = _BLANK_LINES_RE.sub("\n\n", text)
         return text.strip()
 
     def fetch_content(self, 
@@ -441,7 +672,7 @@ class CommunityThreadSource(DataSource):
             logger.warning("LLM service not available to CommunityThreadSource. Cannot summarize. Skipping.")
             return None # Or return preprocessed text if that's ever useful as a fallback
 
-        system_prompt = load_file_content(self.summary_prompt_filepath)
+        system_prompt = load_prompt_content(self.summary_prompt_filepath)
         if not system_prompt:
             logger.error(f"Could not load community thread summary prompt from '{self.summary_prompt_filepath}'. Skipping.")
             return None
@@ -1,201 +1,305 @@
 # gitcast_library/orchestrator.py
 import os
 import logging
-from typing import List, Optional
-
-# Attempt project-relative imports first
-try:
-    from .config import AppConfig
-    from .utils import load_file_content # Removed logger import, use logging.getLogger()
-    from .datasources import DataSource, GitRepoSource, ReleaseNotesSource, BlogDataSource, CommunityThreadSource
-    from .services import LanguageModelService, TextToSpeechService
-except ImportError:
-    # Fallback for scenarios where the package structure isn't recognized (e.g. direct script execution)
-    from config import AppConfig
-    from utils import load_file_content
-    from datasources import DataSource, GitRepoSource, ReleaseNotesSource, BlogDataSource, CommunityThreadSource
-    from services import LanguageModelService, TextToSpeechService
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from .config import AppConfig
+from .utils import load_file_content, load_prompt_content # Removed logger import, use logging.getLogger()
+from .datasources import DataSource, GitRepoSource, ReleaseNotesSource, BlogDataSource, CommunityThreadSource
+from .services import LanguageModelService, TextToSpeechService
 
 # It's generally better to get the logger instance this way
 logger = logging.getLogger(__name__) # Or your specific application logger name e.g., 'wizcast.orchestrator'
 
+# Suffix appended to each candidate repo path during the scan; plain string
+# concatenation on DirEntry.path avoids an os.path.join call per entry.
+_GIT_DIR_SUFFIX = os.sep + '.git'
+
 class GitCastOrchestrator:
+    # Sentinel distinguishing "service not built yet" from "construction
+    # failed" (which caches as None so failures are not retried).
+    _SERVICE_UNSET = object()
+
     def __init__(self, config: AppConfig):
         self.config = config
         self.data_sources: List[DataSource] = []
-        self.llm_service: Optional[LanguageModelService] = None
-        self.tts_service: Optional[TextToSpeechService] = None
-        
-        self._initialize_services()
+        self._llm_service = self._SERVICE_UNSET
+        self._tts_service = self._SERVICE_UNSET
+        self._path_stat_cache: Dict[str, Optional[os.stat_result]] = {}
+
+        # Constants for the orchestrator's lifetime (mp3_base_filepath is
+        # timestamped once per config); computed here instead of per step.
+        # The names must stay in sync with TextToSpeechService's outputs.
+        self._expected_full_mp3_path = config.mp3_base_filepath + "_full.mp3"
+        self._expected_single_mp3_path = config.mp3_base_filepath + ".mp3"
+        self._summary_dirname = os.path.dirname(config.summary_text_filepath)
+
+        # Output directories are fixed for the orchestrator's lifetime, so
+        # create them once here; the per-write makedirs calls (a stat per
+        # path component each) are gone from the run() hot path.
+        for directory in {os.path.dirname(config.raw_combined_input_filepath), self._summary_dirname}:
+            os.makedirs(directory, exist_ok=True)
+
         self._initialize_data_sources()
 
-    def _initialize_services(self):
-        if not self.config.skip_llm:
-            try:
-                self.llm_service = LanguageModelService(self.config)
-                logger.info("Language Model Service initialized.")
-            except ValueError as e:
-                logger.error(f"Error initializing Language Model Service: {e}")
-                self.llm_service = None # Ensure it's None on failure
-        
-        if not self.config.skip_tts:
+    @property
+    def llm_service(self) -> Optional[LanguageModelService]:
+        # Built on first use: a run that skips the LLM (or never reaches it
+        # because no content was collected) never pays for SDK setup.
+        if self._llm_service is self._SERVICE_UNSET:
+            self._llm_service = None
+            if not self.config.skip_llm:
+                try:
+                    self._llm_service = LanguageModelService(self.config)
+                    logger.info("Language Model Service initialized.")
+                except ValueError as e:
+                    logger.error("Error initializing Language Model Service: %s", e)
+        return self._llm_service
+
+    @property
+    def tts_service(self) -> Optional[TextToSpeechService]:
+        if self._tts_service is self._SERVICE_UNSET:
+            self._tts_service = None
+            if not self.config.skip_tts:
+                try:
+                    self._tts_service = TextToSpeechService(self.config)
+                    logger.info("Text-to-Speech Service initialized.")
+                except RuntimeError as e: # Catch specific errors TextToSpeechService might raise
+                    logger.error("Error initializing Text-to-Speech Service: %s", e)
+        return self._tts_service
+
+    def _path_exists(self, path: str) -> bool:
+        """Existence probe backed by a per-run stat cache.
+
+        Control-path files (community thread input, summary, MP3 outputs)
+        get probed from several steps; one stat per path per run is enough.
+        run() resets the cache so a fresh invocation re-probes everything.
+        """
+        if path not in self._path_stat_cache:
             try:
-                self.tts_service = TextToSpeechService(self.config)
-                logger.info("Text-to-Speech Service initialized.")
-            except RuntimeError as e: # Catch specific errors TextToSpeechService might raise
-                logger.error(f"Error initializing Text-to-Speech Service: {e}")
-                self.tts_service = None # Ensure it's None on failure
+                self._path_stat_cache[path] = os.stat(path)
+            except OSError:
+                self._path_stat_cache[path] = None
+        return self._path_stat_cache[path] is not None
 
     def _initialize_data_sources(self):
         logger.info("Initializing data sources...")
-        # Release Notes Source
-        docs_repo_full_path = os.path.join(self.config.repos_dir, self.config.docs_repo_name)
-        if os.path.isdir(docs_repo_full_path):
-            self.data_sources.append(ReleaseNotesSource(docs_repo_path=docs_repo_full_path, config=self.config))
-            logger.info(f"Added ReleaseNotesSource for '{self.config.docs_repo_name}'.")
-        else:
-            logger.info(f"Docs repo '{docs_repo_full_path}' not found. ReleaseNotesSource skipped.")
+        # One scandir pass over repos_dir serves both the docs-repo probe and
+        # the git repo scan below: each DirEntry caches its stat result, so
+        # repeated checks cost nothing, and the listing doubles as the
+        # existence check on repos_dir. Symlinks are followed — a symlinked
+        # checkout under repos/ is as much a repo as a real directory.
+        repos_dir_entries: List[os.DirEntry] = []
+        repos_dir_found = True
+        try:
+            with os.scandir(self.config.repos_dir) as it:
+                repos_dir_entries = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            repos_dir_found = False
+        repo_dir_names = {entry.name for entry in repos_dir_entries}
 
-        # Blog Data Source
-        if not self.config.skip_blog:
-            if self.config.blog_url:
-                self.data_sources.append(BlogDataSource(config=self.config))
-                logger.info(f"Added BlogDataSource for URL: {self.config.blog_url}.")
-            else:
-                logger.info("No blog URL configured. BlogDataSource skipped.")
-        else:
-            logger.info("BlogDataSource skipped via --skip-blog.")
-
-        # Community Thread Source
-        if not self.config.skip_community_thread:
-            # self.config.community_thread_input_filepath should be an absolute path or resolvable
-            if os.path.exists(self.config.community_thread_input_filepath):
-                self.data_sources.append(CommunityThreadSource(config=self.config))
-                logger.info(f"Added CommunityThreadSource for file: {self.config.community_thread_input_filepath}.")
+        # The one-off sources, declaratively: (class, skip reason or None,
+        # input available?, extra constructor kwargs, detail for the log).
+        # Adding a source type means adding a row here, not a new if-block.
+        docs_repo_full_path = os.path.join(self.config.repos_dir, self.config.docs_repo_name)
+        source_specs = (
+            (ReleaseNotesSource,
+             None,
+             self.config.docs_repo_name in repo_dir_names,
+             {"docs_repo_path": docs_repo_full_path},
+             docs_repo_full_path),
+            (BlogDataSource,
+             "--skip-blog" if self.config.skip_blog else None,
+             bool(self.config.blog_url),
+             {},
+             self.config.blog_url),
+            (CommunityThreadSource,
+             "--skip-community-thread" if self.config.skip_community_thread else None,
+             not self.config.skip_community_thread
+                 and self._path_exists(self.config.community_thread_input_filepath),
+             {},
+             self.config.community_thread_input_filepath),
+        )
+        for source_cls, skip_reason, available, kwargs, detail in source_specs:
+            if skip_reason:
+                logger.info("%s skipped via %s.", source_cls.__name__, skip_reason)
+            elif available:
+                self.data_sources.append(source_cls(config=self.config, **kwargs))
+                logger.info("Added %s (%s).", source_cls.__name__, detail)
             else:
-                logger.info(f"Community thread file '{self.config.community_thread_input_filepath}' not found. CommunityThreadSource skipped.")
-        else:
-            logger.info("CommunityThreadSource skipped via --skip-community-thread.")
+                logger.info("%s input '%s' not available; skipped.", source_cls.__name__, detail)
 
         # Git Repository Sources
-        if os.path.isdir(self.config.repos_dir): # Ensure repos_dir itself exists
-            logger.info(f"Scanning for Git repositories in '{self.config.repos_dir}'...")
-            for item_name in sorted(os.listdir(self.config.repos_dir)):
-                item_path = os.path.join(self.config.repos_dir, item_name)
-                if os.path.isdir(item_path) and os.path.isdir(os.path.join(item_path, '.git')):
-                    self.data_sources.append(GitRepoSource(repo_name=item_name, repo_path=item_path, config=self.config))
-                    logger.info(f"Added GitRepoSource for '{item_name}'.")
+        if repos_dir_found:
+            logger.info("Scanning for Git repositories in '%s'...", self.config.repos_dir)
+
+            # The .git probe and constructor validation are stat-bound, so
+            # run them through a small pool once there are enough candidates
+            # to matter.
+            def _probe_repo(entry: os.DirEntry) -> Optional[GitRepoSource]:
+                # exists() rather than isdir(): .git is a plain file in
+                # worktree and submodule checkouts.
+                if os.path.exists(entry.path + _GIT_DIR_SUFFIX):
+                    return GitRepoSource(repo_name=entry.name, repo_path=entry.path, config=self.config)
+                return None
+
+            if len(repos_dir_entries) >= 4:
+                with ThreadPoolExecutor(max_workers=min(8, len(repos_dir_entries))) as executor:
+                    probed_sources = list(executor.map(_probe_repo, repos_dir_entries))
+            else:
+                probed_sources = [_probe_repo(entry) for entry in repos_dir_entries]
+
+            # Determinism only matters for the sources that survive the
+            # probe, so sort that (much smaller) set rather than the whole
+            # directory listing.
+            for source in sorted(
+                    (source for source in probed_sources if source is not None),
+                    key=lambda source: source.repo_name):
+                self.data_sources.append(source)
+                logger.info("Added GitRepoSource for '%s'.", source.repo_name)
         else:
-            logger.warning(f"Repositories directory '{self.config.repos_dir}' not found. Skipping GitRepoSource initialization.")
+            logger.warning("Repositories directory '%s' not found. Skipping GitRepoSource initialization.", self.config.repos_dir)
         
-        logger.info(f"Initialized {len(self.data_sources)} data source(s).")
+        logger.info("Initialized %d data source(s).", len(self.data_sources))
 
     def _collect_content_from_sources(self) -> Optional[str]:
-        logger.info(f"--- Step 1: Collecting Content (for week of {self.config.target_monday.strftime('%B %d, %Y')}) ---")
-        all_fetched_content_parts: List[str] = []
-        
+        """Collect all source content into the raw-input file.
+
+        Returns the path to the combined file (or None if nothing was
+        collected). Sections are streamed to disk as they are assembled, so
+        the combined payload is never duplicated in memory; downstream steps
+        read it back only when they actually need it.
+        """
+        if logger.isEnabledFor(logging.INFO): # strftime is not free; skip it when INFO is off
+            logger.info("--- Step 1: Collecting Content (for week of %s) ---", self.config.target_monday.strftime('%B %d, %Y'))
         if not self.data_sources:
             logger.warning("No data sources initialized. Nothing to collect.")
             return None
 
-        for source in self.data_sources:
-            logger.info(f"Fetching from data source: {source.name}...")
-            # Pass llm_service if the source might need it (e.g., for summarization within the source)
-            content = source.fetch_content(
-                reference_date=self.config.current_processing_date,
-                llm_service=self.llm_service 
-            )
-            if content and content.strip():
-                all_fetched_content_parts.append(
-                    f"{source.get_section_header()}\n{content.strip()}\n{source.get_section_footer()}"
-                )
-                logger.info(f"Successfully gathered content from {source.name}.")
-            else:
-                logger.info(f"No content gathered from {source.name}.")
-        
-        if not all_fetched_content_parts:
-            logger.warning("No content collected from any data source. Nothing to summarize.")
-            return None
-        
-        final_llm_input = "\n\n".join(all_fetched_content_parts)
+        # All sources are independent and I/O-bound (git subprocesses, HTTP,
+        # file reads, LLM calls), so fetch them all concurrently; assembly
+        # below keeps the configured source order.
+        logger.info("Fetching from %d data source(s) concurrently...", len(self.data_sources))
+        fetched = DataSource.fetch_many(
+            self.data_sources,
+            reference_date=self.config.current_processing_date,
+            llm_service=self.llm_service
+        )
+
+        raw_input_filepath = self.config.raw_combined_input_filepath
+        sections_written = 0
         try:
-            # Ensure the directory for the raw input file exists
-            os.makedirs(os.path.dirname(self.config.raw_combined_input_filepath), exist_ok=True)
-            with open(self.config.raw_combined_input_filepath, "w", encoding="utf-8") as f:
-                f.write(final_llm_input)
-            logger.info(f"Combined raw input for LLM saved to: {self.config.raw_combined_input_filepath}")
+            with open(raw_input_filepath, "w", encoding="utf-8") as f:
+                for source in self.data_sources:
+                    content = fetched[source]
+                    if content and content.strip():
+                        if sections_written:
+                            f.write("\n\n")
+                        f.write(f"{source.get_section_header()}\n{content.strip()}\n{source.get_section_footer()}")
+                        sections_written += 1
+                        logger.info("Successfully gathered content from %s.", source.name)
+                    else:
+                        logger.info("No content gathered from %s.", source.name)
         except IOError as e:
-            logger.warning(f"Could not save combined raw input to '{self.config.raw_combined_input_filepath}': {e}")
-        return final_llm_input
+            logger.error("Could not save combined raw input to '%s': %s", raw_input_filepath, e)
+            return None
 
-    def _generate_summary_script(self, llm_input_text: str) -> Optional[str]:
+        if not sections_written:
+            logger.warning("No content collected from any data source. Nothing to summarize.")
+            try:
+                os.remove(raw_input_filepath)
+            except OSError:
+                pass
+            return None
+
+        logger.info("Combined raw input for LLM saved to: %s", raw_input_filepath)
+        return raw_input_filepath
+
+    def _generate_summary_script(self, llm_input_filepath: str) -> Optional[str]:
         logger.info("--- Step 2: Generating Podcast Script via LLM ---")
         summary_filepath = self.config.summary_text_filepath # This should be an absolute path or resolvable
 
         if self.config.skip_llm:
             logger.info("LLM step skipped via --skip-llm flag.")
-            if os.path.exists(summary_filepath):
-                logger.info(f"Loading existing script from: {summary_filepath}")
+            if self._path_exists(summary_filepath):
+                logger.info("Loading existing script from: %s", summary_filepath)
                 return load_file_content(summary_filepath)
-            logger.warning(f"LLM skipped and no existing script file found at: {summary_filepath}")
+            logger.warning("LLM skipped and no existing script file found at: %s", summary_filepath)
             return None
 
         if not self.llm_service:
             logger.error("LLM Service not initialized (or failed to initialize), but LLM step not skipped. Cannot generate script.")
             return None
 
-        system_prompt = load_file_content(self.config.system_prompt_filepath)
+        # Prompt files are small and rarely edited; the mtime-keyed cache
+        # makes repeat loads across re-entrant run() calls a dict hit.
+        system_prompt = load_prompt_content(self.config.system_prompt_filepath)
         if not system_prompt: 
-            logger.critical(f"Main system prompt '{self.config.system_prompt_filepath}' is missing or empty. Cannot generate script.")
+            logger.critical("Main system prompt '%s' is missing or empty. Cannot generate script.", self.config.system_prompt_filepath)
             return None
 
         generated_script: Optional[str] = None
-        if os.path.exists(summary_filepath) and not self.config.overwrite_summary:
-            logger.info(f"Podcast script file '{summary_filepath}' already exists. Loading it.")
+        if self._path_exists(summary_filepath) and not self.config.overwrite_summary:
+            logger.info("Podcast script file '%s' already exists. Loading it.", summary_filepath)
             generated_script = load_file_content(summary_filepath)
             if not generated_script: 
-                logger.warning(f"Existing script at '{summary_filepath}' was empty or unreadable. Will attempt to regenerate.")
+                logger.warning("Existing script at '%s' was empty or unreadable. Will attempt to regenerate.", summary_filepath)
         
         if not generated_script or self.config.overwrite_summary: 
             if self.config.overwrite_summary and generated_script: # Log if overwriting
-                logger.info(f"Overwriting existing summary file: {summary_filepath}")
-            
-            generated_script = self.llm_service.generate_summary(
-                system_prompt_text=system_prompt,
-                user_prompt_text=llm_input_text
-            )
+                logger.info("Overwriting existing summary file: %s", summary_filepath)
+
+            # The combined payload is only read back from disk when the LLM
+            # is actually invoked; loading an existing script above never
+            # pulls it into memory at all.
+            llm_input_text = load_file_content(llm_input_filepath)
+            if not llm_input_text:
+                logger.error("Combined raw input at '%s' is missing or empty. Cannot generate script.", llm_input_filepath)
+                return None
+
+            # The content-addressed cache makes a re-run over unchanged inputs
+            # free; --overwrite-summary bypasses it for a genuinely fresh call.
+            if self.config.overwrite_summary:
+                generated_script = self.llm_service.generate_summary(
+                    system_prompt_text=system_prompt,
+                    user_prompt_text=llm_input_text
+                )
+            else:
+                generated_script = self.llm_service.generate_summary_cached(
+                    system_prompt_text=system_prompt,
+                    user_prompt_text=llm_input_text
+                )
             if generated_script and not generated_script.lower().startswith("error:"): # Check for explicit error markers
                 try:
-                    os.makedirs(os.path.dirname(summary_filepath), exist_ok=True)
                     with open(summary_filepath, "w", encoding="utf-8") as f:
                         f.write(generated_script)
-                    logger.info(f"Successfully saved podcast script to: {summary_filepath}")
+                    logger.info("Successfully saved podcast script to: %s", summary_filepath)
                 except IOError as e:
-                    logger.error(f"Error writing script to file '{summary_filepath}': {e}")
+                    logger.error("Error writing script to file '%s': %s", summary_filepath, e)
                     generated_script = None # Indicate failure
             else:
-                logger.error(f"Failed to generate script from LLM. Response: {generated_script or 'N/A'}")
+                logger.error("Failed to generate script from LLM. Response: %s", generated_script or 'N/A')
                 generated_script = None # Indicate failure
         
         return generated_script
 
     def _generate_audio_from_script(self, podcast_script_text: str) -> List[str]:
         logger.info("--- Step 3: Generating TTS Audio ---")
-        # Determine the expected full MP3 path for skip_tts scenario
-        # self.config.mp3_base_filepath should be a base path for outputs, e.g., output_dir/timestamp_base
-        expected_full_mp3_path = self.config.mp3_base_filepath + "_full.mp3"
-        expected_single_mp3_path = self.config.mp3_base_filepath + ".mp3"
+        # Expected output paths are precomputed once in __init__.
+        expected_full_mp3_path = self._expected_full_mp3_path
+        expected_single_mp3_path = self._expected_single_mp3_path
 
         if self.config.skip_tts:
             logger.info("TTS step skipped via --skip-tts flag.")
             # Check if an existing MP3 (full or single part) can be used
-            if os.path.exists(expected_full_mp3_path):
-                logger.info(f"Using existing full MP3: {expected_full_mp3_path}")
+            if self._path_exists(expected_full_mp3_path):
+                logger.info("Using existing full MP3: %s", expected_full_mp3_path)
                 return [expected_full_mp3_path]
-            if os.path.exists(expected_single_mp3_path): # if no full, check for single
-                logger.info(f"Using existing single part MP3: {expected_single_mp3_path}")
+            if self._path_exists(expected_single_mp3_path): # if no full, check for single
+                logger.info("Using existing single part MP3: %s", expected_single_mp3_path)
                 return [expected_single_mp3_path]
-            logger.warning(f"TTS skipped and no existing MP3 found at '{expected_full_mp3_path}' or '{expected_single_mp3_path}'.")
+            logger.warning("TTS skipped and no existing MP3 found at '%s' or '%s'.", expected_full_mp3_path, expected_single_mp3_path)
             return []
 
         if not self.tts_service:
@@ -210,67 +314,58 @@ class GitCastOrchestrator:
         audio_files = self.tts_service.synthesize_to_mp3(podcast_script_text)
         if audio_files:
             # Log the basenames for conciseness, but audio_files contains full paths
-            logger.info(f"TTS audio generation complete. File(s) in '{self.config.output_dir}': {', '.join(map(os.path.basename, audio_files))}")
+            if logger.isEnabledFor(logging.INFO): # basename-join over every part is wasted work when INFO is off
+                logger.info("TTS audio generation complete. File(s) in '%s': %s", self.config.output_dir, ', '.join(map(os.path.basename, audio_files)))
         else:
             logger.warning("TTS generation failed or produced no audio files.")
         return audio_files # Returns list of absolute paths
 
     def run(self) -> Optional[str]: # Changed return type
         logger.info("--- WizCast Processing Start ---")
+        self._path_stat_cache.clear() # Re-probe everything on a fresh run
         
         final_audio_path: Optional[str] = None # To store the path of the final MP3
 
-        llm_input = self._collect_content_from_sources()
-        if not llm_input:
+        llm_input_filepath = self._collect_content_from_sources()
+        if not llm_input_filepath:
             logger.warning("Exiting: No content collected for LLM processing.")
             return None # Return None on failure to collect content
 
-        script_text = self._generate_summary_script(llm_input)
+        script_text = self._generate_summary_script(llm_input_filepath)
         
         if script_text:
             generated_audio_files = self._generate_audio_from_script(script_text)
             if generated_audio_files:
-                # Find the main audio file (e.g., the one ending in "_full.mp3" or the only one if not chunked)
-                # This assumes tts_service.synthesize_to_mp3 and config.mp3_base_filepath are consistent
-                
-                # Priority: Look for a file ending with "_full.mp3"
-                # self.config.mp3_base_filepath is the base for naming, e.g., "output_wizcast/wizcast_digest_202506050913"
-                # The full file would be "output_wizcast/wizcast_digest_202506050913_full.mp3"
-                # The _generate_audio_from_script method is already expected to return this path if it exists
-                # and if skip_tts is true.
-
-                # The paths in generated_audio_files are absolute.
-                # We need to find the one that corresponds to the combined/final audio.
-                # A simple heuristic: if a file ends with "_full.mp3", that's likely it.
-                # Otherwise, if only one file, that's it.
-                # If multiple parts but no "_full.mp3" (e.g., combining failed), this logic might need refinement
-                # or the TTS service should clearly indicate the main output file.
-
+                # The TTS service names its outputs from the same
+                # mp3_base_filepath the orchestrator precomputes, so the main
+                # file is an exact-path lookup — no suffix heuristics that
+                # could mis-pick a chunk with "_full" in its name.
+                audio_set = set(generated_audio_files)
                 main_mp3_abs_path = None
-                for f_path in generated_audio_files:
-                    if f_path.endswith("_full.mp3"):
-                        main_mp3_abs_path = f_path
-                        break
-                if not main_mp3_abs_path and len(generated_audio_files) == 1: # If no "_full" but only one file
+                if self._expected_full_mp3_path in audio_set:
+                    main_mp3_abs_path = self._expected_full_mp3_path
+                elif self._expected_single_mp3_path in audio_set:
+                    main_mp3_abs_path = self._expected_single_mp3_path
+                elif len(generated_audio_files) == 1:
                     main_mp3_abs_path = generated_audio_files[0]
-                elif not main_mp3_abs_path and generated_audio_files: # Fallback if no "_full" but multiple files (take last one as a guess)
-                    logger.warning("Could not definitively identify a '_full.mp3' file, using the last generated audio file.")
-                    main_mp3_abs_path = generated_audio_files[-1]
+                else:
+                    logger.error("Could not identify the main MP3 among the generated audio files; refusing to guess.")
 
 
                 if main_mp3_abs_path:
                     try:
-                        # Convert to relative path from the current working directory.
-                        # run.sh ensures that main.py is run from the project root.
-                        project_root_cwd = os.getcwd()
+                        # Convert to a path relative to the project root.
+                        # run.sh runs main.py from there, so this matches the
+                        # old getcwd() behavior without the ambient syscall.
+                        project_root_cwd = self.config.project_root
                         relative_mp3_path = os.path.relpath(main_mp3_abs_path, project_root_cwd)
                         final_audio_path = relative_mp3_path
-                        logger.info(f"Successfully generated audio. Relative path: {final_audio_path}")
+                        logger.info("Successfully generated audio. Relative path: %s", final_audio_path)
                     except ValueError as e:
-                        logger.error(f"Error creating relative path for '{main_mp3_abs_path}' from '{project_root_cwd}': {e}")
+                        logger.error("Error creating relative path for '%s' from '%s': %s", main_mp3_abs_path, project_root_cwd, e)
                         # Fallback: return absolute path if relative path generation fails
                         final_audio_path = main_mp3_abs_path
-                        logger.warning(f"Falling back to absolute path: {final_audio_path}")
+                        logger.warning("Falling back to absolute path: %s", final_audio_path)
                 else:
                     logger.warning("Audio files were generated, but could not identify the main MP3 output file to return.")
             # If generated_audio_files is empty, it means TTS failed or was skipped and no existing file was found.
@@ -2,7 +2,10 @@
 import os
 import re
 import time
+import hashlib
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import google.generativeai as genai
@@ -10,14 +13,36 @@ from google.cloud import texttospeech as google_cloud_tts # Alias to avoid confu
 
 # Assuming utils.py and config.py are in the same package directory
 try:
-    from .utils import markdown_to_plain_text, logger
+    from .utils import markdown_to_plain_text, ensure_dir, logger
     from .config import AppConfig
 except ImportError:
     # Fallback for different execution context or testing
-    from utils import markdown_to_plain_text, logger
+    from utils import markdown_to_plain_text, ensure_dir, logger
     from config import AppConfig
 
 
+_LLM_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "wizcast", "llm_summaries")
+
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def _file_has_content(path: str) -> bool:
+    # One stat syscall instead of the exists()+getsize() pair.
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
+def _utf8_bytelen(s: str) -> int:
+    # For ASCII text (the vast majority of what the chunker sees) the UTF-8
+    # byte length equals the character count, and str.isascii() is a C-level
+    # scan that avoids allocating an encoded copy just to take its len.
+    if s.isascii():
+        return len(s)
+    return len(s.encode('utf-8'))
+
+
 class LanguageModelService:
     def __init__(self, config: AppConfig):
         self.config = config
@@ -32,6 +57,50 @@ class LanguageModelService:
             ]
         ]
 
+    def generate_summary_cached(self, system_prompt_text: str, user_prompt_text: str) -> Optional[str]:
+        """Disk-cached generate_summary for deterministic, repeatable inputs.
+
+        Results are stored one file per key under ~/.cache/wizcast, keyed by
+        a hash of model + system prompt + user text, so a re-run over
+        unchanged inputs skips the remote call entirely, and editing either
+        the prompt or the input invalidates naturally. Error responses are
+        never cached, and writes go through os.replace so a crashed run
+        cannot leave a truncated entry behind.
+        """
+        key = hashlib.blake2b(
+            "\x00".join((self.config.gemini_model_name, system_prompt_text, user_prompt_text)).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        cache_path = os.path.join(_LLM_CACHE_DIR, key + ".txt")
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                logger.debug(f"LLM summary cache hit: {key}")
+                return f.read()
+        except OSError:
+            pass
+
+        summary = self.generate_summary(
+            system_prompt_text=system_prompt_text,
+            user_prompt_text=user_prompt_text
+        )
+        if summary and not summary.lower().startswith("error:"):
+            try:
+                os.makedirs(_LLM_CACHE_DIR, exist_ok=True)
+                # Per-writer temp name: duplicate inputs summarized on two
+                # pool workers share a key, and a fixed cache_path + ".tmp"
+                # would let their writes interleave before os.replace.
+                fd, tmp_path = tempfile.mkstemp(dir=_LLM_CACHE_DIR, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(summary)
+                    os.replace(tmp_path, cache_path)
+                except OSError:
+                    os.unlink(tmp_path)
+                    raise
+            except OSError as e:
+                logger.warning(f"Could not write LLM summary cache entry {cache_path}: {e}")
+        return summary
+
     def generate_summary(self, system_prompt_text: str, user_prompt_text: str) -> Optional[str]:
         logger.info(f"Sending request to Gemini ('{self.config.gemini_model_name}'). User prompt: ~{len(user_prompt_text)} chars. System prompt: ~{len(system_prompt_text)} chars.")
         try:
@@ -95,7 +164,11 @@ class TextToSpeechService:
     def _chunk_text(self, text: str) -> List[str]:
         if not text: return []
         chunks: List[str] = []
-        current_chunk = ""
+        # Accumulate each chunk as (parts, running byte length) instead of a
+        # growing string: appending to the old string and re-encoding it to
+        # measure bytes made every iteration rescan the whole buffer.
+        current_parts: List[str] = []
+        current_bytelen = 0  # byte length of '\n\n'.join(current_parts)
         # Split by paragraphs first, as they are natural breakpoints.
         paragraphs = text.split('\n\n')
 
@@ -103,73 +176,75 @@ class TextToSpeechService:
             paragraph = paragraph.strip() # Ensure no leading/trailing whitespace on paragraph itself
             if not paragraph: continue
 
-            paragraph_bytes = paragraph.encode('utf-8')
-            current_chunk_bytes = current_chunk.encode('utf-8')
+            paragraph_bytelen = _utf8_bytelen(paragraph)
 
             # Check if adding this paragraph (plus a potential separator) exceeds the limit
-            if len(current_chunk_bytes) + (2 if current_chunk else 0) + len(paragraph_bytes) <= self.tts_chunk_limit_bytes:
-                if current_chunk: current_chunk += "\n\n" + paragraph
-                else: current_chunk = paragraph
+            if current_bytelen + (2 if current_parts else 0) + paragraph_bytelen <= self.tts_chunk_limit_bytes:
+                current_bytelen += (2 if current_parts else 0) + paragraph_bytelen
+                current_parts.append(paragraph)
             else:
                 # Current chunk is full (or adding the new paragraph would make it too full)
-                if current_chunk: # Finalize the current_chunk
-                    chunks.append(current_chunk)
-                    current_chunk = "" # Reset for the next chunk
+                if current_parts: # Finalize the current chunk
+                    chunks.append('\n\n'.join(current_parts))
+                    current_parts = [] # Reset for the next chunk
+                    current_bytelen = 0
 
                 # Now deal with the paragraph that didn't fit.
                 # If the paragraph itself is too large, it needs to be split.
-                if len(paragraph_bytes) > self.tts_chunk_limit_bytes:
-                    logger.debug(f"TTS Chunker: Paragraph too long ({len(paragraph_bytes)} bytes), splitting by sentences.")
-                    sentences = re.split(r'(?<=[.!?])\s+', paragraph) # Split by sentences
-                    temp_sentence_chunk = ""
+                if paragraph_bytelen > self.tts_chunk_limit_bytes:
+                    logger.debug(f"TTS Chunker: Paragraph too long ({paragraph_bytelen} bytes), splitting by sentences.")
+                    sentences = _SENTENCE_SPLIT_RE.split(paragraph) # Split by sentences
+                    temp_parts: List[str] = []
+                    temp_bytelen = 0  # byte length of ' '.join(temp_parts)
                     for sentence in sentences:
                         sentence = sentence.strip()
                         if not sentence: continue
-                        sentence_bytes = sentence.encode('utf-8')
-                        temp_sentence_chunk_bytes = temp_sentence_chunk.encode('utf-8')
+                        sentence_bytelen = _utf8_bytelen(sentence)
 
-                        if len(temp_sentence_chunk_bytes) + (1 if temp_sentence_chunk else 0) + len(sentence_bytes) <= self.tts_chunk_limit_bytes:
-                            if temp_sentence_chunk: temp_sentence_chunk += " " + sentence
-                            else: temp_sentence_chunk = sentence
+                        if temp_bytelen + (1 if temp_parts else 0) + sentence_bytelen <= self.tts_chunk_limit_bytes:
+                            temp_bytelen += (1 if temp_parts else 0) + sentence_bytelen
+                            temp_parts.append(sentence)
                         else:
-                            if temp_sentence_chunk: chunks.append(temp_sentence_chunk)
+                            if temp_parts:
+                                chunks.append(' '.join(temp_parts))
+                                temp_parts = []
+                                temp_bytelen = 0
                             # If a single sentence is still too long (rare for TTS limits, but possible)
-                            if len(sentence_bytes) > self.tts_chunk_limit_bytes:
-                                logger.debug(f"TTS Chunker: Sentence too long ({len(sentence_bytes)} bytes), hard splitting.")
-                                # Hard split the oversized sentence
-                                # This is a fallback; ideal would be more intelligent splitting.
-                                start_idx = 0
-                                while start_idx < len(sentence):
-                                    # Estimate max characters based on bytes (very rough)
-                                    # Assuming average 1-2 bytes per char for English text after UTF-8 encoding
-                                    estimated_max_chars = self.tts_chunk_limit_bytes // 1.5 
-                                    sub_sentence = sentence[start_idx : int(start_idx + estimated_max_chars)]
-                                    
-                                    # Refine to ensure byte limit
-                                    while len(sub_sentence.encode('utf-8')) > self.tts_chunk_limit_bytes:
-                                        sub_sentence = sub_sentence[:-1] # Chop off last char
-                                        if not sub_sentence: break # Avoid infinite loop if first char is multi-byte > limit
-                                    
-                                    if sub_sentence:
-                                        chunks.append(sub_sentence)
-                                        start_idx += len(sub_sentence)
-                                    else: # Should not happen if logic is correct
-                                        logger.warning("TTS Chunker: Sub-sentence became empty during hard split. Breaking.")
-                                        break 
-                                temp_sentence_chunk = "" # Reset after hard split
-                            else: # Current sentence becomes the new temp_sentence_chunk
-                                temp_sentence_chunk = sentence
-                    if temp_sentence_chunk: chunks.append(temp_sentence_chunk)
-                    current_chunk = "" # Ensure current_chunk is reset after handling oversized paragraph
-                else: # Paragraph is not oversized itself, so it starts the new current_chunk
-                    current_chunk = paragraph
-        
-        if current_chunk: # Add any remaining part in current_chunk
-            chunks.append(current_chunk)
-        
+                            if sentence_bytelen > self.tts_chunk_limit_bytes:
+                                logger.debug(f"TTS Chunker: Sentence too long ({sentence_bytelen} bytes), hard splitting.")
+                                # Hard split on UTF-8 byte boundaries: encode
+                                # once, take limit-sized byte slices, and back
+                                # each cut off any continuation bytes
+                                # (0b10xxxxxx) so no code point is torn.
+                                sentence_bytes = sentence.encode('utf-8')
+                                pos = 0
+                                while pos < len(sentence_bytes):
+                                    end = pos + self.tts_chunk_limit_bytes
+                                    if end >= len(sentence_bytes):
+                                        end = len(sentence_bytes)
+                                    else:
+                                        while end > pos and (sentence_bytes[end] & 0xC0) == 0x80:
+                                            end -= 1
+                                    if end == pos: # Only if the limit is smaller than one code point
+                                        logger.warning("TTS Chunker: Could not advance during hard split. Breaking.")
+                                        break
+                                    chunks.append(sentence_bytes[pos:end].decode('utf-8'))
+                                    pos = end
+                            else: # Current sentence becomes the new sentence chunk
+                                temp_parts = [sentence]
+                                temp_bytelen = sentence_bytelen
+                    if temp_parts: chunks.append(' '.join(temp_parts))
+                else: # Paragraph is not oversized itself, so it starts the new current chunk
+                    current_parts = [paragraph]
+                    current_bytelen = paragraph_bytelen
+
+        if current_parts: # Add any remaining chunk
+            chunks.append('\n\n'.join(current_parts))
+
         return [c for c in chunks if c.strip()] # Filter out any empty strings
 
     def _synthesize_single_chunk(self, text_chunk: str, output_filename: str) -> bool:
+        base_name = os.path.basename(output_filename)
         try:
             input_text_proto = google_cloud_tts.SynthesisInput(text=text_chunk)
             voice_params = google_cloud_tts.VoiceSelectionParams(
@@ -180,7 +255,7 @@ class TextToSpeechService:
                 audio_encoding=google_cloud_tts.AudioEncoding.MP3
                 # Can add speaking_rate, pitch, effects here if desired
             )
-            logger.info(f"Synthesizing speech for: {os.path.basename(output_filename)} ({len(text_chunk)} chars, {len(text_chunk.encode('utf-8'))} bytes)")
+            logger.info(f"Synthesizing speech for: {base_name} ({len(text_chunk)} chars, {_utf8_bytelen(text_chunk)} bytes)")
             
             request = google_cloud_tts.SynthesizeSpeechRequest(
                 input=input_text_proto,
@@ -194,7 +269,7 @@ class TextToSpeechService:
             logger.info(f"Audio content written to file: {output_filename}")
             return True
         except Exception as e:
-            logger.error(f"Failed to synthesize speech for {os.path.basename(output_filename)}: {e}")
+            logger.error(f"Failed to synthesize speech for {base_name}: {e}")
             # import traceback
             # traceback.print_exc() # For detailed error during development
             return False
@@ -202,6 +277,7 @@ class TextToSpeechService:
     def synthesize_to_mp3(self, text_to_speak: str) -> List[str]:
         output_base = self.config.mp3_base_filepath # From AppConfig
         overwrite = self.config.overwrite_tts     # From AppConfig
+        ensure_dir(self.config.output_dir) # Output dir is created lazily, on first write
         logger.info(f"Processing TTS for base: {os.path.basename(output_base)}")
 
         if not text_to_speak or not text_to_speak.strip():
@@ -219,24 +295,31 @@ class TextToSpeechService:
             return []
         logger.info(f"Text divided into {len(text_chunks)} chunk(s) for TTS.")
 
-        part_mp3_files: List[str] = []
-        synthesis_successful_for_all = True
+        part_mp3_files = [f"{output_base}_part{i+1}.mp3" for i in range(len(text_chunks))]
 
-        for i, chunk in enumerate(text_chunks):
-            part_filename = f"{output_base}_part{i+1}.mp3"
-            part_mp3_files.append(part_filename)
+        def _synthesize_part(chunk: str, part_filename: str) -> bool:
             # Check if file exists and has content, and if overwrite is false
-            if not overwrite and os.path.exists(part_filename) and os.path.getsize(part_filename) > 0:
+            if not overwrite and _file_has_content(part_filename):
                 logger.info(f"MP3 part exists and is not empty: {os.path.basename(part_filename)}. Skipping synthesis.")
-                continue
-            if not self._synthesize_single_chunk(chunk, part_filename):
-                synthesis_successful_for_all = False
-            # API rate limits might require a delay. Google TTS usually allows decent QPS.
-            # If hitting limits, uncomment the time.sleep below.
-            # time.sleep(0.5) # e.g., 0.5 second delay between requests
-        
-        # Filter for parts that were actually created and have content
-        valid_part_files = [f for f in part_mp3_files if os.path.exists(f) and os.path.getsize(f) > 0]
+                return True
+            return self._synthesize_single_chunk(chunk, part_filename)
+
+        # Each chunk is an independent network-bound API call and the client
+        # is thread-safe, so overlap the per-request latency through a small
+        # pool. The worker cap keeps QPS friendly to Google TTS rate limits.
+        max_workers = min(self.config.tts_concurrency, len(text_chunks))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_synthesize_part, text_chunks, part_mp3_files))
+        else:
+            results = [_synthesize_part(c, f) for c, f in zip(text_chunks, part_mp3_files)]
+        synthesis_successful_for_all = all(results)
+
+
+        # A True result already means the part is on disk with content —
+        # either the skip branch verified it or synthesis just wrote it —
+        # so no second stat pass over the parts is needed.
+        valid_part_files = [f for f, ok in zip(part_mp3_files, results) if ok]
 
         if not valid_part_files:
             logger.error("TTS failed to produce any valid audio parts.")
@@ -246,47 +329,41 @@ class TextToSpeechService:
 
         if len(valid_part_files) > 1:
             combined_mp3_filepath = output_base + "_full.mp3"
+            combined_basename = os.path.basename(combined_mp3_filepath)
             # If combined file exists and we are not overwriting, return it.
             if not overwrite and os.path.exists(combined_mp3_filepath):
-                logger.info(f"Combined MP3 exists: {os.path.basename(combined_mp3_filepath)}. Skipping combination.")
+                logger.info(f"Combined MP3 exists: {combined_basename}. Skipping combination.")
                 # Optionally, clean up individual parts if the combined one exists and is preferred
                 # for part_f_cleanup in valid_part_files:
                 #     if os.path.exists(part_f_cleanup): try: os.remove(part_f_cleanup) except OSError: pass
                 return [combined_mp3_filepath]
 
-            logger.info(f"Attempting to combine {len(valid_part_files)} MP3 parts into {os.path.basename(combined_mp3_filepath)}...")
-            concat_list_filename = output_base + "_concat_list.txt"
+            logger.info(f"Attempting to combine {len(valid_part_files)} MP3 parts into {combined_basename}...")
             ffmpeg_error_msg = None
             try:
-                with open(concat_list_filename, "w", encoding="utf-8") as f_list:
-                    for mp3_file in valid_part_files:
-                        # Ensure paths are absolute or correctly relative for ffmpeg
-                        f_list.write(f"file '{os.path.abspath(mp3_file)}'\n")
-                
-                # --- MODIFIED FFMPEG COMMAND ---
-                # Instead of -c copy, we let ffmpeg re-encode to fix headers.
-                # Using a common bitrate like 128k for speech.
-                # -y: overwrite output files without asking
-                # -f concat: input format is a concat list
-                # -safe 0: needed if paths in concat list are absolute/complex
-                # -i: input file (the list)
-                # -ar 44100: Set audio sample rate (optional, but good for consistency)
-                # -ac 1: Set audio channels to mono (speech is usually mono)
-                # -b:a 128k: Set audio bitrate to 128 kbps for MP3
-                # Using libmp3lame which is a high-quality MP3 encoder.
+                abs_part_paths = list(map(os.path.abspath, valid_part_files))
+
+                # Always re-encode: concatenated MP3 parts each carry their
+                # own Xing/LAME header, so a -c copy remux keeps the first
+                # part's duration and breaks seeking in most players. The
+                # concat list is fed over stdin, so there is no temp file.
+                concat_body = "".join(f"file '{p}'\n" for p in abs_part_paths)
                 ffmpeg_command = [
-                    'ffmpeg', '-y', 
-                    '-f', 'concat', '-safe', '0', '-i', concat_list_filename,
+                    'ffmpeg', '-y',
+                    '-f', 'concat', '-safe', '0',
+                    '-protocol_whitelist', 'file,pipe', '-i', 'pipe:0',
                     '-ar', '44100', '-ac', '1', '-b:a', '128k', # Re-encode options
                     combined_mp3_filepath
                 ]
-                # print(f"      Executing FFmpeg command: {' '.join(ffmpeg_command)}") # For debugging
-                process = subprocess.run(ffmpeg_command, capture_output=True, text=True, check=False) # check=False to inspect stderr
-                
-                if process.returncode != 0:
-                    ffmpeg_error_msg = f"ffmpeg failed with return code {process.returncode}: {process.stderr}"
+                process = subprocess.run(ffmpeg_command, input=concat_body.encode('utf-8'),
+                                         capture_output=True, check=False)
+                returncode, stderr_bytes = process.returncode, process.stderr
+
+                if returncode != 0:
+                    stderr_text = stderr_bytes.decode('utf-8', errors='replace')
+                    ffmpeg_error_msg = f"ffmpeg failed with return code {returncode}: {stderr_text}"
                 else:
-                    logger.info(f"Successfully combined MP3s: {os.path.basename(combined_mp3_filepath)}")
+                    logger.info(f"Successfully combined MP3s: {combined_basename}")
                     # Cleanup part files after successful combination
                     for part_f_cleanup in valid_part_files:
                         if os.path.exists(part_f_cleanup): 
@@ -294,15 +371,12 @@ class TextToSpeechService:
                             except OSError as e_del: logger.warning(f"Could not delete part file {part_f_cleanup}: {e_del}")
                     return [combined_mp3_filepath]
 
-            except FileNotFoundError: 
+            except FileNotFoundError:
                 ffmpeg_error_msg = "ffmpeg command not found. Please ensure it's installed and in PATH."
-            except subprocess.CalledProcessError as e: # Should be caught by check=False now
-                ffmpeg_error_msg = f"ffmpeg execution error: {e.stderr}"
             except Exception as e_gen: # Catch any other unexpected error during ffmpeg process
                 ffmpeg_error_msg = f"Unexpected error during ffmpeg combination: {e_gen}"
-            finally:
-                if os.path.exists(concat_list_filename): os.remove(concat_list_filename)
-            
+
+
             if ffmpeg_error_msg:
                 logger.error(f"ERROR combining MP3s: {ffmpeg_error_msg} Individual part files are kept.")
                 return valid_part_files # Return parts if combination failed
@@ -310,28 +384,30 @@ class TextToSpeechService:
         elif len(valid_part_files) == 1:
             # Only one part, rename it to the final name (if not already correct)
             single_part_file = valid_part_files[0]
+            single_part_basename = os.path.basename(single_part_file)
             # Standardize final name for single part to not have "_part1"
-            final_single_mp3_filepath = output_base + ".mp3" 
+            final_single_mp3_filepath = output_base + ".mp3"
+            final_single_basename = os.path.basename(final_single_mp3_filepath)
 
             if os.path.abspath(single_part_file) == os.path.abspath(final_single_mp3_filepath):
-                 logger.info(f"Single audio part is already correctly named: {os.path.basename(final_single_mp3_filepath)}")
+                 logger.info(f"Single audio part is already correctly named: {final_single_basename}")
                  return [final_single_mp3_filepath]
 
             if os.path.exists(final_single_mp3_filepath) and not overwrite:
-                logger.info(f"Target MP3 {os.path.basename(final_single_mp3_filepath)} exists. Original part {os.path.basename(single_part_file)} kept.")
+                logger.info(f"Target MP3 {final_single_basename} exists. Original part {single_part_basename} kept.")
                 # Decide whether to return the existing final or the new part.
                 # For consistency, if not overwriting, the existing final is what user expects.
-                return [final_single_mp3_filepath] 
+                return [final_single_mp3_filepath]
             try:
                 if os.path.exists(final_single_mp3_filepath) and overwrite:
-                    logger.info(f"Overwriting existing target MP3: {os.path.basename(final_single_mp3_filepath)}")
+                    logger.info(f"Overwriting existing target MP3: {final_single_basename}")
                     os.remove(final_single_mp3_filepath)
-                
+
                 os.rename(single_part_file, final_single_mp3_filepath)
-                logger.info(f"Single audio part renamed to: {os.path.basename(final_single_mp3_filepath)}")
+                logger.info(f"Single audio part renamed to: {final_single_basename}")
                 return [final_single_mp3_filepath]
             except OSError as e_rename:
-                logger.error(f"Error renaming part {os.path.basename(single_part_file)} to {os.path.basename(final_single_mp3_filepath)}: {e_rename}. Part kept with original name.")
+                logger.error(f"Error renaming part {single_part_basename} to {final_single_basename}: {e_rename}. Part kept with original name.")
                 return [single_part_file] # Return the original part name if rename fails
         
         return [] # Should not be reached if valid_part_files had items.
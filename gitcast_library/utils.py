@@ -1,41 +1,86 @@
 # gitcast_library/utils.py
+import atexit
 import os
 import re
 import sys
+import functools
+import hashlib
+import json
 import logging
+import queue
 from datetime import datetime, timedelta, date
 import calendar
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 
+# Prefer lxml's C parser for HTML when it is installed; fall back to the
+# stdlib parser so the dependency stays soft.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 # --- Logging System ---
 logger = logging.getLogger('wizcast')
 
+# The running QueueListener, if any; one atexit hook drains it on shutdown.
+_log_listener = None
+
+
+def _stop_log_listener():
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(log_level=logging.INFO, log_format=None, log_file=None):
-    """Setup application logging with syslog-style format."""
+    """Setup application logging with syslog-style format.
+
+    Handlers sit behind a QueueHandler/QueueListener pair: a log call on
+    any pipeline thread just enqueues the record, and the stream/file
+    writes happen on one background thread, off the critical path. The
+    listener is drained at exit (and whenever logging is reconfigured) so
+    no records are lost.
+    """
+    # Imported here, not at module top, so the --help path stays lean.
+    from logging.handlers import QueueHandler, QueueListener
+
     if not log_format:
         log_format = '%(asctime)s %(name)s[%(process)d] %(levelname)s: %(message)s'
-    
+
     # Configure the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-    
-    # Clear existing handlers to avoid duplicates
+
+    # Drain any previous listener, then clear existing handlers to avoid duplicates
+    _stop_log_listener()
     for handler in root_logger.handlers:
         root_logger.removeHandler(handler)
-    
+
     # Always add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(logging.Formatter(log_format))
-    root_logger.addHandler(console_handler)
-    
+    targets = [console_handler]
+
     # Add file handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(logging.Formatter(log_format))
-        root_logger.addHandler(file_handler)
-    
+        targets.append(file_handler)
+
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, *targets, respect_handler_level=True)
+    _log_listener.start()
+    root_logger.addHandler(QueueHandler(log_queue))
+
     # Return the main application logger
     return logger
 
@@ -50,10 +95,12 @@ def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 def load_file_content(filepath: str) -> str | None:
-    if not os.path.exists(filepath):
+    try:
+        st = os.stat(filepath)  # One stat covers both the exists and empty checks
+    except OSError:
         logger.error(f"File not found - {filepath}")
         return None
-    if os.path.getsize(filepath) == 0:
+    if st.st_size == 0:
         logger.warning(f"File is empty - {filepath}")
         return ""
     try:
@@ -63,9 +110,32 @@ def load_file_content(filepath: str) -> str | None:
         logger.error(f"Error reading file {filepath}: {e}")
         return None
 
+@functools.lru_cache(maxsize=32)
+def _load_file_content_cached(filepath: str, mtime_ns: int) -> str | None:
+    return load_file_content(filepath)
+
+def load_prompt_content(filepath: str) -> str | None:
+    """Cached load_file_content for small, rarely-edited files like prompts.
+
+    Keyed on (path, st_mtime_ns) so an edited prompt is re-read, while repeat
+    loads within and across pipeline stages are served from memory. Large
+    one-shot payloads (the combined raw input, git logs) should keep using
+    load_file_content directly rather than pinning megabytes in this cache.
+    """
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        logger.error(f"File not found - {filepath}")
+        return None
+    return _load_file_content_cached(filepath, mtime_ns)
+
 # --- Date Helpers ---
+@functools.lru_cache(maxsize=32)
 def get_monday_of_week(input_date: date) -> date:
-    return input_date - timedelta(days=input_date.weekday())
+    # Pure function of the date, and called for every release-note filename
+    # and blog post scanned in a run; the cache makes repeats a dict hit.
+    # Ordinal arithmetic sidesteps the timedelta allocation on misses.
+    return date.fromordinal(input_date.toordinal() - input_date.weekday())
 
 def get_file_modification_date(filepath: str) -> date | None:
     """Get the modification date of a file."""
@@ -76,6 +146,15 @@ def get_file_modification_date(filepath: str) -> date | None:
         logger.warning(f"Could not get modification date for '{filepath}': {e}")
         return None
         
+_RN_FILENAME_RE = re.compile(r"week-of-([a-zA-Z]+)-(\d+)(?:st|nd|rd|th)?(?:-(\d{4}))?", re.IGNORECASE)
+
+# Month-name resolution as one dict hit instead of a linear scan over
+# calendar.month_abbr plus a strptime fallback; keys cover both full names
+# and three-letter abbreviations, lowercased.
+_MONTH_LOOKUP = {m.lower(): i for i, m in enumerate(calendar.month_abbr) if m}
+_MONTH_LOOKUP.update({m.lower(): i for i, m in enumerate(calendar.month_name) if m})
+
+
 def parse_date_from_release_note_filename(filename: str, current_year: int, full_filepath: str = None) -> date | None:
     """Parse the date from a release note filename.
     
@@ -87,7 +166,7 @@ def parse_date_from_release_note_filename(filename: str, current_year: int, full
     Returns:
         The Monday of the week for the parsed date, or None if parsing failed
     """
-    match = re.search(r"week-of-([a-zA-Z]+)-(\d+)(?:st|nd|rd|th)?(?:-(\d{4}))?", filename, re.IGNORECASE)
+    match = _RN_FILENAME_RE.search(filename)
     if not match:
         return None
         
@@ -114,17 +193,10 @@ def parse_date_from_release_note_filename(filename: str, current_year: int, full
         year = current_year
         logger.debug(f"Falling back to current year {year} for '{filename}'")
     
-    try:
-        month_abbr = month_name_str[:3].capitalize()
-        month_number = list(calendar.month_abbr).index(month_abbr)
-    except ValueError:
-        try:
-            month_number = datetime.strptime(month_name_str, "%B").month
-        except ValueError:
-            logger.warning(f"Could not parse month '{month_name_str}' from RN filename '{filename}'")
-            return None
-    if month_number == 0: # Should not happen
-        logger.warning(f"Month '{month_name_str}' resulted in 0 from RN filename '{filename}'")
+    month_number = (_MONTH_LOOKUP.get(month_name_str.lower())
+                    or _MONTH_LOOKUP.get(month_name_str[:3].lower()))
+    if not month_number:
+        logger.warning(f"Could not parse month '{month_name_str}' from RN filename '{filename}'")
         return None
     try:
         parsed_date_in_filename = date(year, month_number, day)
@@ -133,19 +205,21 @@ def parse_date_from_release_note_filename(filename: str, current_year: int, full
         logger.warning(f"Invalid date (y:{year},m:{month_number},d:{day}) from RN filename '{filename}'")
         return None
 
+_BLOG_DATE_PATTERNS = [re.compile(p) for p in (
+    r"([A-Za-z]+\s+\d{1,2},\s+\d{4})",  # Month DD, YYYY (e.g., May 14, 2025)
+    r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})",  # DD Month YYYY (e.g., 14 May 2025)
+    r"([A-Za-z]+\s+\d{1,2}\s+\d{4})",  # Month DD YYYY (e.g., May 14 2025) - no comma
+    r"(\d{4}-\d{2}-\d{2})",            # YYYY-MM-DD
+    r"(\d{1,2}/\d{1,2}/\d{4})"          # MM/DD/YYYY or DD/MM/YYYY (parsing handles ambiguity later)
+)]
+
+
 def parse_blog_post_date_from_text(text_containing_date: str) -> date | None:
     if not text_containing_date:
         return None
-    date_patterns = [
-        r"([A-Za-z]+\s+\d{1,2},\s+\d{4})",  # Month DD, YYYY (e.g., May 14, 2025)
-        r"(\d{1,2}\s+[A-Za-z]+\s+\d{4})",  # DD Month YYYY (e.g., 14 May 2025)
-        r"([A-Za-z]+\s+\d{1,2}\s+\d{4})",  # Month DD YYYY (e.g., May 14 2025) - no comma
-        r"(\d{4}-\d{2}-\d{2})",            # YYYY-MM-DD
-        r"(\d{1,2}/\d{1,2}/\d{4})"          # MM/DD/YYYY or DD/MM/YYYY (parsing handles ambiguity later)
-    ]
     extracted_date_str = None
-    for pattern in date_patterns:
-        match = re.search(pattern, text_containing_date)
+    for pattern in _BLOG_DATE_PATTERNS:
+        match = pattern.search(text_containing_date)
         if match:
             extracted_date_str = match.group(1)
             break
@@ -168,30 +242,118 @@ def parse_blog_post_date_from_text(text_containing_date: str) -> date | None:
     return None
 
 # --- Web Content Fetching ---
+_HTTP_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "wizcast", "http")
+
+# One session for every fetch in the process: connections (and their TLS
+# handshakes) are pooled and reused across the blog index and per-post
+# requests instead of being torn down after each one.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+_SESSION.headers.update({'User-Agent': 'GitCastBot/1.0 (LanguageModelGenerated)'})
+
+
+def close_session():
+    """Release pooled HTTP connections; safe to call more than once."""
+    _SESSION.close()
+
+
+def _http_cache_path(url: str) -> str:
+    return os.path.join(_HTTP_CACHE_DIR, hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest() + ".json")
+
+
 def fetch_url_content_text(url: str, timeout: int = 15) -> str | None:
+    """Fetch a URL, revalidating against an on-disk cache when possible.
+
+    Cached responses store the server's ETag/Last-Modified validators; when
+    present they are replayed as conditional-GET headers, so unchanged pages
+    cost one 304 round-trip with an empty body instead of a full download.
+    Responses without validators are fetched normally and not cached.
+    """
+    cache_path = _http_cache_path(url)
+    cached = None
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        cached = None
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers['If-None-Match'] = cached["etag"]
+        if cached.get("last_modified"):
+            headers['If-Modified-Since'] = cached["last_modified"]
+
     try:
-        headers = {'User-Agent': 'GitCastBot/1.0 (LanguageModelGenerated)'}
-        response = requests.get(url, timeout=timeout, headers=headers)
+        response = _SESSION.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached:
+            logger.debug(f"HTTP cache revalidated (304) for {url}")
+            return cached["body"]
         response.raise_for_status()
-        return response.text
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching URL {url}: {e}")
         return None
 
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            os.makedirs(_HTTP_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "last_modified": last_modified, "body": response.text}, f)
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {url}: {e}")
+    return response.text
+
 # --- Text Manipulation ---
+# Markdown stripping is fused into two compiled alternations instead of a
+# dozen sequential re.sub passes, each of which walked and reallocated the
+# whole document. One pass strips line-prefix markup (headers, list markers,
+# rules, blockquotes); the `+` lets stacked prefixes like "> # " strip in a
+# single match, as the cascading passes used to. The other strips inline
+# markup, with a callback that returns whichever alternative's group matched.
+_MD_LINE_PREFIX_RE = re.compile(
+    r"^(?:\s*#{1,6}\s+"       # headers
+    r"|\s*[\*\-\+]\s+"        # bullet list markers
+    r"|\s*\d+\.\s+"           # ordered list markers
+    r"|\s*[\-\*\_]{3,}\s*$"   # horizontal rules
+    r"|\s*>\s?)+",            # blockquote markers
+    re.MULTILINE)
+# The emphasis and code-span bodies use negated character classes rather
+# than lazy dot-star: on a long line full of unpaired delimiters (release
+# notes sometimes embed stack traces or code), a lazy `.*?` rescans to the
+# end of the line for every opener, which is quadratic. A negated class
+# fails fast at the next delimiter, keeping matching linear.
+_MD_INLINE_RE = re.compile(
+    r"\*\*([^*\n]+)\*\*"           # bold
+    r"|__([^_\n]+)__"
+    r"|\*([^*\n]+)\*"              # italic
+    r"|_([^_\n]+)_"
+    r"|!\[([^\]]*)\]\([^\)]+\)"    # image -> alt text
+    r"|\[([^\]]+)\]\([^\)]+\)"     # link -> link text
+    r"|`([^`\n]+)`")               # inline code
+_MD_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+def _md_inline_repl(match: re.Match) -> str:
+    return match.group(match.lastindex)
+
+
 def markdown_to_plain_text(markdown_text: str) -> str:
     if not markdown_text: return ""
-    soup = BeautifulSoup(markdown_text, "html.parser")
-    text = soup.get_text(separator="\n")
-    text = re.sub(r"^\s*#{1,6}\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"\*\*(.*?)\*\*", r"\1", text); text = re.sub(r"__(.*?)__", r"\1", text)
-    text = re.sub(r"\*(.*?)\*", r"\1", text); text = re.sub(r"_(.*?)_", r"\1", text)
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
-    text = re.sub(r"!\[([^\]]*)\]\([^\)]+\)", r"\1", text)
-    text = re.sub(r"^\s*[\*\-\+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*[\-\*\_]{3,}\s*$", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*>\s?", "", text, flags=re.MULTILINE)
-    text = re.sub(r"`(.*?)`", r"\1", text)
-    text = re.sub(r"\n\s*\n", "\n\n", text)
+    if '<' in markdown_text:
+        soup = BeautifulSoup(markdown_text, HTML_PARSER)
+        text = soup.get_text(separator="\n")
+    else:
+        # Pure markdown with no tags — the common case for LLM-generated
+        # scripts — skips building an HTML tree just to flatten it back out.
+        text = markdown_text
+    text = _MD_LINE_PREFIX_RE.sub("", text)
+    # Repeat until stable so nested markup like **_x_** fully unwraps, as it
+    # did when each marker had its own pass; plain text settles in one round.
+    text, n_subs = _MD_INLINE_RE.subn(_md_inline_repl, text)
+    while n_subs:
+        text, n_subs = _MD_INLINE_RE.subn(_md_inline_repl, text)
+    text = _MD_BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
\ No newline at end of file